@@ -0,0 +1,228 @@
+"""
+Unit tests for the data import script helpers
+"""
+
+import asyncio
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pydantic import BaseModel
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+# Add project root to path so the scripts package resolves
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+
+from scripts import _bulk_import
+from scripts._bulk_import import build_insert_if_missing, flush_upserts, run_pipeline
+from scripts.import_hotels_restaurants import build_upsert
+from scripts.import_thasl_hotels import classify, extract_city
+from scripts.view_database_images import NormalizedImage, normalize_image
+
+
+def make_model(bulk_write):
+    """Create a stand-in Beanie model whose collection uses the given bulk_write"""
+    model = MagicMock()
+    model.get_motor_collection.return_value.bulk_write = bulk_write
+    return model
+
+
+class SampleDocument(BaseModel):
+    """Minimal model with a source field, a defaulted field and a bookkeeping field"""
+    id: Optional[str] = None
+    name: str
+    rating: float = 0.0
+
+
+class TestRunPipeline:
+    """Test the producer/consumer import pipeline"""
+    
+    @staticmethod
+    async def entries(count):
+        for i in range(count):
+            yield i
+    
+    @pytest.mark.asyncio
+    async def test_all_consumers_stop_after_the_source_is_drained(self):
+        """Test every entry is processed once and each consumer gets its own end marker"""
+        seen = []
+        
+        async def worker(entry):
+            await asyncio.sleep(0)
+            seen.append(entry)
+        
+        count = await asyncio.wait_for(run_pipeline(self.entries(25), worker), timeout=5)
+        
+        assert count == 25
+        assert sorted(seen) == list(range(25))
+    
+    @pytest.mark.asyncio
+    async def test_empty_source_shuts_down(self):
+        """Test the pipeline finishes when the source yields nothing"""
+        worker = AsyncMock()
+        
+        count = await asyncio.wait_for(run_pipeline(self.entries(0), worker), timeout=5)
+        
+        assert count == 0
+        worker.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_entries_are_spread_over_several_consumers(self, monkeypatch):
+        """Test a slow entry does not hold back the others when several consumers run"""
+        monkeypatch.setattr(_bulk_import, "CONSUMER_COUNT", 3)
+        release = asyncio.Event()
+        finished = []
+        
+        async def worker(entry):
+            if entry == 0:
+                await release.wait()
+            finished.append(entry)
+            if len(finished) == 2:
+                release.set()
+        
+        await asyncio.wait_for(run_pipeline(self.entries(3), worker), timeout=5)
+        
+        assert finished[-1] == 0
+
+
+class TestFlushUpserts:
+    """Test batched unordered upserts"""
+    
+    @pytest.mark.asyncio
+    async def test_empty_batch_skips_the_write(self):
+        """Test no bulk_write is sent when nothing is queued"""
+        bulk_write = AsyncMock()
+        
+        assert await flush_upserts(make_model(bulk_write), []) == (0, 0, 0)
+        bulk_write.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_successful_write_counts_and_clears_the_queue(self):
+        """Test upserted and matched counts come from the result and the list is emptied"""
+        bulk_write = AsyncMock(return_value=MagicMock(upserted_count=2, matched_count=1))
+        operations = [UpdateOne({"k": i}, {"$set": {"v": i}}, upsert=True) for i in range(3)]
+        
+        counts = await flush_upserts(make_model(bulk_write), operations)
+        
+        assert counts == (2, 1, 0)
+        assert operations == []
+        assert bulk_write.call_args.kwargs["ordered"] is False
+        assert len(bulk_write.call_args.args[0]) == 3
+    
+    @pytest.mark.asyncio
+    async def test_bulk_write_error_counts_failures(self):
+        """Test partial results and write errors are counted instead of raised"""
+        error = BulkWriteError({
+            "nUpserted": 3,
+            "nMatched": 1,
+            "writeErrors": [
+                {"index": 1, "code": 11000, "errmsg": "duplicate key"},
+                {"index": 4, "code": 11000, "errmsg": "duplicate key"},
+            ],
+        })
+        operations = [UpdateOne({"k": i}, {"$set": {"v": i}}, upsert=True) for i in range(6)]
+        
+        counts = await flush_upserts(make_model(AsyncMock(side_effect=error)), operations)
+        
+        assert counts == (3, 1, 2)
+        assert operations == []
+
+
+class TestUpsertBuilders:
+    """Test the upsert documents built for imported records"""
+    
+    NOW = datetime(2024, 1, 1)
+    
+    def test_build_upsert_splits_source_fields_from_defaults(self):
+        """Test given fields are refreshed while model defaults are written only on insert"""
+        operation = build_upsert(SampleDocument(name="Galle Fort Hotel"), {"name": "Galle Fort Hotel"}, self.NOW)
+        update = operation._doc
+        
+        assert update["$set"] == {"name": "Galle Fort Hotel", "updated_at": self.NOW}
+        assert update["$setOnInsert"] == {"rating": 0.0, "created_at": self.NOW}
+        assert operation._upsert is True
+    
+    def test_build_upsert_refreshes_explicitly_given_defaults(self):
+        """Test a field passed explicitly is refreshed even when it equals the default"""
+        operation = build_upsert(SampleDocument(name="Kandy Inn", rating=0.0), {"name": "Kandy Inn"}, self.NOW)
+        
+        assert "rating" in operation._doc["$set"]
+        assert "rating" not in operation._doc["$setOnInsert"]
+    
+    def test_build_insert_if_missing_only_sets_on_insert(self):
+        """Test the insert-if-missing upsert never overwrites an existing record"""
+        operation = build_insert_if_missing({"slug": "sigiriya"}, {"slug": "sigiriya"}, self.NOW)
+        
+        assert operation._doc == {
+            "$setOnInsert": {"slug": "sigiriya", "created_at": self.NOW, "updated_at": self.NOW}
+        }
+        assert operation._filter == {"slug": "sigiriya"}
+
+
+class TestThaslClassification:
+    """Test THASL hotel classification and city extraction"""
+    
+    @pytest.mark.parametrize("classification,expected", [
+        ("five star boutique hotel", ("boutique", "5")),
+        ("3 star hotel", ("resort", "3")),
+        ("guest house", ("guesthouse", "unrated")),
+        ("ayurvedic resort", ("resort", "unrated")),
+    ])
+    def test_classify(self, classification, expected):
+        """Test category keywords and star ratings written as digits or words"""
+        assert classify(classification) == expected
+    
+    def test_compound_city_wins_over_its_substring(self):
+        """Test an address naming Nuwara Eliya is not claimed by Ella"""
+        assert extract_city("Ella Road, Nuwara Eliya", "Central") == "Nuwara Eliya"
+    
+    def test_city_match_needs_word_boundaries(self):
+        """Test a city name inside a longer word is not matched"""
+        assert extract_city("Kandyan Arts Lane", "Uva Province") == "Badulla"
+    
+    @pytest.mark.parametrize("province,expected", [
+        ("North Western Province", "Kurunegala"),
+        ("North Central Province", "Anuradhapura"),
+        ("Western Province", "Colombo"),
+    ])
+    def test_compound_province_wins_over_its_substring(self, province, expected):
+        """Test North Western and North Central are not claimed by Western or Central"""
+        assert extract_city("No 12, Main Street", province) == expected
+    
+    def test_unknown_location_falls_back_to_country(self):
+        """Test an address and province with no known city"""
+        assert extract_city("", "") == "Sri Lanka"
+
+
+class TestNormalizeImage:
+    """Test image entry normalization for the database image viewer"""
+    
+    def test_string_entry(self):
+        """Test a bare URL string"""
+        assert normalize_image("https://example.com/a.jpg") == NormalizedImage(
+            "https://example.com/a.jpg", False, "", True
+        )
+    
+    def test_dict_entry_with_fallback_url_and_alt_text(self):
+        """Test _url is used when url is missing and English alt text is extracted"""
+        image = {"_url": "http://example.com/b.jpg", "is_primary": True, "alt_text": {"en": "Beach", "si": "x"}}
+        
+        assert normalize_image(image) == NormalizedImage("http://example.com/b.jpg", True, "Beach", True)
+    
+    def test_invalid_url_and_null_alt_text(self):
+        """Test a non-http URL is marked invalid and a null alt text becomes empty"""
+        assert normalize_image({"url": "ftp://example.com/c.jpg", "alt_text": {"en": None}}) == NormalizedImage(
+            "ftp://example.com/c.jpg", False, "", False
+        )
+    
+    def test_missing_url(self):
+        """Test a dict without any URL is invalid"""
+        assert normalize_image({"is_primary": False}) == NormalizedImage(None, False, "", False)
+    
+    def test_unsupported_entry(self):
+        """Test entries that are neither strings nor dicts are rejected"""
+        assert normalize_image(42) is None
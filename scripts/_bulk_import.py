@@ -0,0 +1,133 @@
+"""
+Shared bulk-import helpers for the data import scripts
+Batched unordered upserts and a streaming producer/consumer pipeline
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Tuple
+
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    # orjson is optional; the stdlib parser also accepts bytes
+    from json import loads as json_loads
+
+try:
+    import ijson
+except ImportError:
+    # Only stream_json_items needs it; the other helpers work without it
+    ijson = None
+
+logger = logging.getLogger(__name__)
+
+# Motor client options for one-shot bulk imports: a larger pool for the
+# concurrent batch writes and no retryable-write bookkeeping. Writes stay
+# acknowledged because the upsert results drive the import statistics.
+BULK_IMPORT_CLIENT_OPTIONS = {"maxPoolSize": 100, "minPoolSize": 20, "retryWrites": False}
+
+# Streaming pipeline: one producer feeds a bounded queue and this many
+# consumers process its entries
+CONSUMER_COUNT = 4
+QUEUE_SIZE = 1000
+
+# Log progress every this many records instead of once per record
+PROGRESS_INTERVAL = 100
+
+# Number of upserts sent per bulk_write call
+BULK_WRITE_BATCH_SIZE = 1000
+
+# Beanie bookkeeping fields that the upserts manage explicitly or never write
+EXCLUDED_FIELDS = {"id", "revision_id", "created_at", "updated_at"}
+
+
+def load_json(json_file: Path) -> Any:
+    """Read and parse a whole JSON file"""
+    with open(json_file, 'rb') as f:
+        return json_loads(f.read())
+
+
+async def ensure_lookup_indexes(specs: Iterable[Tuple[Any, str, bool]]):
+    """Create the (model, key, unique) indexes that serve the upsert filters"""
+    # Same specs as the model Settings, so this is a no-op when Beanie already built them
+    await asyncio.gather(*(
+        model.get_motor_collection().create_index(key, unique=unique)
+        for model, key, unique in specs
+    ))
+
+
+def dump_fields(document) -> Dict[str, Any]:
+    """Serialize a model for a raw upsert, leaving out the bookkeeping fields"""
+    return document.model_dump(mode="json", by_alias=True, exclude=EXCLUDED_FIELDS)
+
+
+def build_insert_if_missing(fields: Dict[str, Any], key: dict, now: datetime) -> UpdateOne:
+    """Build an upsert that writes fields only when no record matches key"""
+    # Beanie defaults are not applied on this path, so timestamps are set explicitly
+    return UpdateOne(key, {"$setOnInsert": {**fields, "created_at": now, "updated_at": now}}, upsert=True)
+
+
+async def flush_upserts(model, operations: List[UpdateOne]) -> Tuple[int, int, int]:
+    """Send pending upserts in one bulk_write; returns (upserted, matched, failed) counts"""
+    if not operations:
+        return 0, 0, 0
+    
+    # Detach the batch first so concurrent workers keep queueing into an empty list
+    batch = operations[:]
+    operations.clear()
+    
+    try:
+        # Unordered so one bad operation does not abort the rest of the batch
+        result = await model.get_motor_collection().bulk_write(batch, ordered=False)
+        return result.upserted_count, result.matched_count, 0
+    except BulkWriteError as e:
+        write_errors = e.details.get("writeErrors", [])
+        for error in write_errors:
+            logger.error("Write failed at batch index %s: %s", error.get('index'), error.get('errmsg'))
+        return e.details.get("nUpserted", 0), e.details.get("nMatched", 0), len(write_errors)
+
+
+async def stream_json_items(json_file: Path, prefix: str, label: str) -> AsyncIterator[Any]:
+    """Yield the items under prefix from a JSON file without loading the whole file"""
+    if ijson is None:
+        raise ImportError("ijson is required to stream JSON imports: pip install ijson")
+    with open(json_file, 'rb') as f:
+        for count, item in enumerate(ijson.items(f, prefix, use_float=True), 1):
+            yield item
+            if count % PROGRESS_INTERVAL == 0:
+                logger.info("Processed %d %s", count, label)
+                # queue.put only suspends when the queue is full; yield so
+                # consumers and Motor's I/O callbacks get a turn
+                await asyncio.sleep(0)
+
+
+async def run_pipeline(source: AsyncIterator[Any], worker: Callable[[Any], Awaitable[None]]) -> int:
+    """Feed every entry from source to CONSUMER_COUNT concurrent workers; returns the entry count"""
+    queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+    count = 0
+    
+    async def produce():
+        nonlocal count
+        async for entry in source:
+            count += 1
+            await queue.put(entry)
+        # One end-of-stream marker per consumer
+        for _ in range(CONSUMER_COUNT):
+            await queue.put(None)
+    
+    async def consume():
+        while (entry := await queue.get()) is not None:
+            await worker(entry)
+    
+    # Producing overlaps with the consumers' database writes
+    async with asyncio.TaskGroup() as tg:
+        tg.create_task(produce())
+        for _ in range(CONSUMER_COUNT):
+            tg.create_task(consume())
+    
+    return count
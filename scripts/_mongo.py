@@ -0,0 +1,35 @@
+"""
+Shared MongoDB client for maintenance scripts
+Lazily creates one AsyncIOMotorClient per process so scripts reuse its connection pool
+"""
+
+import sys
+from pathlib import Path
+from typing import Optional
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from backend.app.core.config import settings
+
+# Read-mostly scripts need only a handful of sockets, not the driver default of 100
+MONGO_CLIENT_OPTIONS = {"maxPoolSize": 16, "minPoolSize": 2}
+
+_client: Optional[AsyncIOMotorClient] = None
+
+
+def get_client() -> AsyncIOMotorClient:
+    """Return the process-wide client, creating it on first use"""
+    global _client
+    if _client is None:
+        _client = AsyncIOMotorClient(settings.MONGODB_URL, **MONGO_CLIENT_OPTIONS)
+    return _client
+
+
+def close_client() -> None:
+    """Close the shared client so the next get_client() reconnects"""
+    global _client
+    if _client is not None:
+        _client.close()
+        _client = None
@@ -4,7 +4,6 @@ This script imports emergency services from the JSON file into the database.
 """
 
 import asyncio
-import json
 import sys
 from pathlib import Path
 from datetime import datetime
@@ -24,6 +23,7 @@ from backend.app.models.emergency import (
     ContactMethod
 )
 from backend.app.models.attraction import Location, MultilingualContent
+from scripts._bulk_import import load_json
 
 
 # Mapping from JSON type to EmergencyType enum
@@ -44,6 +44,50 @@ SERVICE_LEVEL_MAPPING = {
     "Ambulance": ServiceLevel.EMERGENCY,
 }
 
+# Lowercase form of each service type, used for keywords and descriptions
+TYPE_KEYWORDS = {service_type: service_type.lower() for service_type in TYPE_MAPPING}
+
+# Province lookup for the canonical city names returned by get_city_from_location
+PROVINCE_MAPPING = {
+    "Colombo": "Western",
+    "Moratuwa": "Western",
+    "Dehiwala": "Western",
+    "Wattala": "Western",
+    "Homagama": "Western",
+    "Gampaha": "Western",
+    "Negombo": "Western",
+    "Kalutara": "Western",
+    "Kandy": "Central",
+    "Peradeniya": "Central",
+    "Gampola": "Central",
+    "Nawalapitiya": "Central",
+    "Matale": "Central",
+    "Nuwara Eliya": "Central",
+    "Galle": "Southern",
+    "Matara": "Southern",
+    "Balapitiya": "Southern",
+    "Elpitiya": "Southern",
+    "Udugama": "Southern",
+    "Ahangama": "Southern",
+    "Ahungalla": "Southern",
+    "Akmeemana": "Southern",
+    "Akuressa": "Southern",
+    "Jaffna": "Northern",
+    "Vavuniya": "Northern",
+    "Anuradhapura": "North Central",
+    "Trincomalee": "Eastern",
+    "Batticaloa": "Eastern",
+    "Akkaraipattu": "Eastern",
+    "Kalawanchikudi": "Eastern",
+    "Badulla": "Uva",
+    "Ratnapura": "Sabaragamuwa",
+    "Kurunegala": "North Western",
+    "Chilaw": "North Western",
+    "Puttalam": "North Western",
+    "Alawwa": "North Western",
+    "Maharagama": "Western",
+}
+
 
 def get_city_from_location(location: str) -> str:
     """Extract city name from location string"""
@@ -71,46 +115,7 @@ def get_city_from_location(location: str) -> str:
 
 def get_province_from_city(city: str) -> str:
     """Get province from city name"""
-    province_mapping = {
-        "Colombo": "Western",
-        "Moratuwa": "Western",
-        "Dehiwala": "Western",
-        "Wattala": "Western",
-        "Homagama": "Western",
-        "Gampaha": "Western",
-        "Negombo": "Western",
-        "Kalutara": "Western",
-        "Kandy": "Central",
-        "Peradeniya": "Central",
-        "Gampola": "Central",
-        "Nawalapitiya": "Central",
-        "Matale": "Central",
-        "Nuwara Eliya": "Central",
-        "Galle": "Southern",
-        "Matara": "Southern",
-        "Balapitiya": "Southern",
-        "Elpitiya": "Southern",
-        "Udugama": "Southern",
-        "Ahangama": "Southern",
-        "Ahungalla": "Southern",
-        "Akmeemana": "Southern",
-        "Akuressa": "Southern",
-        "Jaffna": "Northern",
-        "Vavuniya": "Northern",
-        "Anuradhapura": "North Central",
-        "Trincomalee": "Eastern",
-        "Batticaloa": "Eastern",
-        "Akkaraipattu": "Eastern",
-        "Kalawanchikudi": "Eastern",
-        "Badulla": "Uva",
-        "Ratnapura": "Sabaragamuwa",
-        "Kurunegala": "North Western",
-        "Chilaw": "North Western",
-        "Puttalam": "North Western",
-        "Alawwa": "North Western",
-        "Maharagama": "Western",
-    }
-    return province_mapping.get(city, "Western")  # Default to Western
+    return PROVINCE_MAPPING.get(city, "Western")  # Default to Western
 
 
 async def import_emergency_services():
@@ -129,8 +134,7 @@ async def import_emergency_services():
     json_file = project_root / "emergency_services_sri_lanka.json"
     print(f"📂 Loading data from: {json_file}")
     
-    with open(json_file, "r", encoding="utf-8") as f:
-        services_data = json.load(f)
+    services_data = load_json(json_file)
     
     print(f"📊 Found {len(services_data)} emergency services to import")
     
@@ -158,6 +162,7 @@ async def import_emergency_services():
             # Get city and province
             city = get_city_from_location(location_str)
             province = get_province_from_city(city)
+            type_keyword = TYPE_KEYWORDS.get(service_type) or service_type.lower()
             
             # Create multilingual content
             name = MultilingualContent(
@@ -179,9 +184,9 @@ async def import_emergency_services():
             )
             
             when_to_contact = MultilingualContent(
-                en=f"Contact {name_en} for {service_type.lower()} services.",
+                en=f"Contact {name_en} for {type_keyword} services.",
                 si=f"{name_si} සම්බන්ධ කර ගන්න.",
-                ta=f"Contact {name_en} for {service_type.lower()} services."
+                ta=f"Contact {name_en} for {type_keyword} services."
             )
             
             # Create location
@@ -248,7 +253,7 @@ async def import_emergency_services():
                     is_active=True,
                     is_verified=True,
                     last_verified=datetime.utcnow(),
-                    keywords=[service_type.lower(), city.lower(), name_en.lower()],
+                    keywords=[type_keyword, city.lower(), name_en.lower()],
                     country=name_en.replace(" Embassy", "").replace(" High Commission", "") if service_type == "Embassy" else None,
                     citizen_services=(service_type == "Embassy"),
                     visa_services=(service_type == "Embassy"),
@@ -4,7 +4,6 @@ Handles Google Places enhanced data with photos, ratings, reviews
 """
 
 import sys
-import json
 import asyncio
 from pathlib import Path
 from typing import Dict, List, Any
@@ -15,19 +14,15 @@ sys.path.append(str(Path(__file__).parent.parent))
 from motor.motor_asyncio import AsyncIOMotorClient
 from beanie import init_beanie
 from pydantic import HttpUrl
+from pymongo.errors import BulkWriteError
 
 from backend.app.core.config import settings
 from backend.app.models.attraction import (
     Attraction, AttractionCategory, Location, MultilingualContent, AttractionImage
 )
-from backend.app.models.hotel import (
-    Hotel, HotelCategory, Location as HotelLocation, 
-    MultilingualContent as HotelMultilingualContent
-)
-from backend.app.models.restaurant import (
-    Restaurant, Location as RestaurantLocation, 
-    MultilingualContent as RestaurantMultilingualContent
-)
+from backend.app.models.hotel import Hotel, HotelCategory
+from backend.app.models.restaurant import Restaurant
+from scripts._bulk_import import load_json
 
 
 # Category mapping
@@ -88,6 +83,25 @@ def process_images(photos: List[Any]) -> List[AttractionImage]:
     return images
 
 
+async def insert_documents(model, documents: List[Any], stats: Dict[str, int], kind: str) -> None:
+    """Bulk insert documents into a model's collection and record inserted/error counts"""
+    if not documents:
+        return
+    
+    try:
+        # Unordered so one bad document does not abort the rest of the collection
+        result = await model.insert_many(documents, ordered=False)
+        inserted = len(result.inserted_ids)
+    except BulkWriteError as e:
+        inserted = e.details.get("nInserted", 0)
+        write_errors = e.details.get("writeErrors", [])
+        for error in write_errors:
+            print(f"Insert failed for {kind} at index {error.get('index')}: {error.get('errmsg')}")
+        stats["errors"] += len(write_errors)
+    
+    stats[kind] += inserted
+
+
 async def import_data():
     """Import data from tourism_data_google_enhanced.json"""
     
@@ -95,8 +109,7 @@ async def import_data():
     json_path = Path(__file__).parent.parent / "tourism_data_google_enhanced.json"
     print(f"Loading data from {json_path}...")
     
-    with open(json_path, 'r', encoding='utf-8') as f:
-        file_data = json.load(f)
+    file_data = load_json(json_path)
     
     data = file_data.get('data', [])
     print(f"Loaded {len(data)} items from enhanced data file")
@@ -121,6 +134,23 @@ async def import_data():
         "updated": 0
     }
     
+    # Fetch existing slugs once so duplicates are skipped without a query per item
+    attraction_slugs, hotel_slugs, restaurant_slugs = await asyncio.gather(
+        Attraction.distinct("slug"),
+        Hotel.distinct("slug"),
+        Restaurant.distinct("slug"),
+    )
+    existing_slugs = {
+        "attraction": set(attraction_slugs),
+        "hotel": set(hotel_slugs),
+        "restaurant": set(restaurant_slugs),
+    }
+    
+    # New documents, partitioned by target collection
+    attractions: List[Attraction] = []
+    hotels: List[Hotel] = []
+    restaurants: List[Restaurant] = []
+    
     for idx, item in enumerate(data, 1):
         try:
             name_en = item.get("verified_name") or item.get("name_en", "Unknown")
@@ -167,6 +197,13 @@ async def import_data():
                 coordinates=coordinates
             )
             
+            short_text = description[:200] if description else ""
+            multilingual_short_description = MultilingualContent(
+                en=short_text,
+                si=short_text,
+                ta=short_text
+            )
+            
             # Create slug
             slug = create_slug(name_en)
             
@@ -177,22 +214,17 @@ async def import_data():
             # Extract website URL
             website_url = extract_url(item.get("website", ""))
             
-            # Insert based on collection type
+            # Build document for the target collection
             if collection_type == "attraction":
                 # Check if exists
-                exists = await Attraction.find_one(Attraction.slug == slug)
-                if exists:
+                if slug in existing_slugs["attraction"]:
                     stats["skipped"] += 1
                     continue
                 
                 attraction = Attraction(
                     name=multilingual_name,
                     description=multilingual_description,
-                    short_description=MultilingualContent(
-                        en=description[:200] if description else "",
-                        si=description[:200] if description else "",
-                        ta=description[:200] if description else ""
-                    ),
+                    short_description=multilingual_short_description,
                     how_to_get_there=MultilingualContent(
                         en=f"Located in {city}",
                         si=f"{city} හි පිහිටා ඇත",
@@ -209,39 +241,21 @@ async def import_data():
                     google_rating=item.get("google_rating"),
                     total_ratings=item.get("google_total_ratings", 0)
                 )
-                await attraction.insert()
-                stats["attractions"] += 1
+                attractions.append(attraction)
+                existing_slugs["attraction"].add(slug)
                 
             elif collection_type == "hotel":
                 # Check if exists
-                exists = await Hotel.find_one(Hotel.slug == slug)
-                if exists:
+                if slug in existing_slugs["hotel"]:
                     stats["skipped"] += 1
                     continue
                 
                 hotel = Hotel(
-                    name=HotelMultilingualContent(
-                        en=name_en,
-                        si=name_si if name_si else name_en,
-                        ta=name_ta if name_ta else name_en
-                    ),
-                    description=HotelMultilingualContent(
-                        en=full_desc,
-                        si=full_desc,
-                        ta=full_desc
-                    ),
-                    short_description=HotelMultilingualContent(
-                        en=description[:200] if description else "",
-                        si=description[:200] if description else "",
-                        ta=description[:200] if description else ""
-                    ),
+                    name=multilingual_name,
+                    description=multilingual_description,
+                    short_description=multilingual_short_description,
                     category=model_category,
-                    location=HotelLocation(
-                        address=item.get("formatted_address", city),
-                        city=city,
-                        province="",
-                        coordinates=coordinates
-                    ),
+                    location=location,
                     slug=slug,
                     is_active=True,
                     is_featured=item.get("google_rating", 0) >= 4.5,
@@ -252,38 +266,20 @@ async def import_data():
                     google_rating=item.get("google_rating"),
                     total_ratings=item.get("google_total_ratings", 0)
                 )
-                await hotel.insert()
-                stats["hotels"] += 1
+                hotels.append(hotel)
+                existing_slugs["hotel"].add(slug)
                 
             elif collection_type == "restaurant":
                 # Check if exists
-                exists = await Restaurant.find_one(Restaurant.slug == slug)
-                if exists:
+                if slug in existing_slugs["restaurant"]:
                     stats["skipped"] += 1
                     continue
                 
                 restaurant = Restaurant(
-                    name=RestaurantMultilingualContent(
-                        en=name_en,
-                        si=name_si if name_si else name_en,
-                        ta=name_ta if name_ta else name_en
-                    ),
-                    description=RestaurantMultilingualContent(
-                        en=full_desc,
-                        si=full_desc,
-                        ta=full_desc
-                    ),
-                    short_description=RestaurantMultilingualContent(
-                        en=description[:200] if description else "",
-                        si=description[:200] if description else "",
-                        ta=description[:200] if description else ""
-                    ),
-                    location=RestaurantLocation(
-                        address=item.get("formatted_address", city),
-                        city=city,
-                        province="",
-                        coordinates=coordinates
-                    ),
+                    name=multilingual_name,
+                    description=multilingual_description,
+                    short_description=multilingual_short_description,
+                    location=location,
                     slug=slug,
                     is_active=True,
                     is_featured=item.get("google_rating", 0) >= 4.5,
@@ -295,18 +291,26 @@ async def import_data():
                     google_rating=item.get("google_rating"),
                     total_ratings=item.get("google_total_ratings", 0)
                 )
-                await restaurant.insert()
-                stats["restaurants"] += 1
+                restaurants.append(restaurant)
+                existing_slugs["restaurant"].add(slug)
             
             # Progress indicator
             if idx % 100 == 0:
-                print(f"Processed {idx}/{len(data)} items...")
+                print(f"Prepared {idx}/{len(data)} items...")
                 
         except Exception as e:
             print(f"Error processing item {idx} ({item.get('name_en', 'unknown')}): {str(e)}")
             stats["errors"] += 1
             continue
     
+    # The three collections are independent, so write them concurrently
+    print("Inserting documents...")
+    await asyncio.gather(
+        insert_documents(Attraction, attractions, stats, "attractions"),
+        insert_documents(Hotel, hotels, stats, "hotels"),
+        insert_documents(Restaurant, restaurants, stats, "restaurants"),
+    )
+    
     # Print statistics
     print("\n" + "="*50)
     print("Import Complete!")
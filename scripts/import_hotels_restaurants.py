@@ -4,8 +4,9 @@ This script imports hotels and restaurants from the JSON file into the database.
 """
 
 import asyncio
-import json
+import logging
 import sys
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 
@@ -15,11 +16,19 @@ sys.path.insert(0, str(project_root))
 
 from motor.motor_asyncio import AsyncIOMotorClient
 from beanie import init_beanie
+from pymongo import UpdateOne
 
 from backend.app.core.config import settings
 from backend.app.models.hotel import Hotel, HotelCategory
 from backend.app.models.restaurant import Restaurant, CuisineType, PriceRange
 from backend.app.models.attraction import Location, MultilingualContent
+from scripts._bulk_import import (
+    BULK_IMPORT_CLIENT_OPTIONS, BULK_WRITE_BATCH_SIZE, dump_fields, ensure_lookup_indexes,
+    flush_upserts as bulk_flush, run_pipeline, stream_json_items
+)
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s %(message)s')
+logger = logging.getLogger(__name__)
 
 
 # Mapping from JSON star_rating to HotelCategory enum
@@ -32,6 +41,60 @@ HOTEL_CATEGORY_MAPPING = {
     "luxury": HotelCategory.LUXURY,
 }
 
+# Enum lookups by member name, so unknown values fall back without raising
+CUISINE_BY_NAME = {member.name: member for member in CuisineType}
+PRICE_RANGE_BY_NAME = {member.name: member for member in PriceRange}
+
+# Shared content for records that have no name/description object
+EMPTY_MLC = MultilingualContent.model_construct(en='', si='', ta='')
+
+# Indexes behind the name.en lookups of the upserts
+LOOKUP_INDEXES = (
+    (Hotel, "name.en", False),
+    (Hotel, "slug", True),
+    (Restaurant, "name.en", False),
+    (Restaurant, "slug", True),
+)
+
+
+def mlc(data) -> MultilingualContent:
+    """Build multilingual content from a trusted JSON object without re-validating it"""
+    if not data:
+        return EMPTY_MLC
+    return MultilingualContent.model_construct(
+        en=data.get('en', ''),
+        si=data.get('si', ''),
+        ta=data.get('ta', '')
+    )
+
+
+@lru_cache(maxsize=64)
+def enum_key(value: str) -> str:
+    """Convert a JSON label such as 'Sri Lankan' to an enum member name"""
+    return value.upper().replace(' ', '_')
+
+
+def build_upsert(document, key: dict, now: datetime) -> UpdateOne:
+    """Build an upsert that refreshes imported fields and fills model defaults only on insert"""
+    fields = dump_fields(document)
+    
+    # Fields given by the source data are refreshed on every run; the remaining
+    # model defaults must not clobber data already stored on existing records
+    to_set = {k: v for k, v in fields.items() if k in document.model_fields_set}
+    to_set["updated_at"] = now
+    on_insert = {k: v for k, v in fields.items() if k not in document.model_fields_set}
+    on_insert["created_at"] = now
+    
+    return UpdateOne(key, {"$set": to_set, "$setOnInsert": on_insert}, upsert=True)
+
+
+async def flush_upserts(model, operations: list, stats: dict, kind: str):
+    """Send pending upserts and record created/updated/skipped counts"""
+    upserted, matched, failed = await bulk_flush(model, operations)
+    stats[f"{kind}_created"] += upserted
+    stats[f"{kind}_updated"] += matched
+    stats[f"{kind}_skipped"] += failed
+
 
 async def import_data():
     """Import hotels and restaurants from JSON file"""
@@ -42,24 +105,17 @@ async def import_data():
     mongo_url = settings.MONGODB_URL
     print(f"🔗 Connecting to MongoDB: {mongo_url}")
     
-    client = AsyncIOMotorClient(mongo_url)
+    client = AsyncIOMotorClient(mongo_url, **BULK_IMPORT_CLIENT_OPTIONS)
     database = client[settings.DATABASE_NAME]
     
     # Initialize beanie
     await init_beanie(database=database, document_models=[Hotel, Restaurant])
+    await ensure_lookup_indexes(LOOKUP_INDEXES)
     print("✅ Connected to database")
     
-    # Load JSON data
+    # JSON data is streamed one record at a time, hotels and restaurants in separate passes
     json_file = project_root / "sample_tourism_data.json"
-    print(f"📂 Loading data from: {json_file}")
-    
-    with open(json_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    hotels_data = data.get('hotels', [])
-    restaurants_data = data.get('restaurants', [])
-    
-    print(f"📊 Found {len(hotels_data)} hotels and {len(restaurants_data)} restaurants to import")
+    print(f"📂 Streaming data from: {json_file}")
     
     # Statistics
     stats = {
@@ -71,27 +127,19 @@ async def import_data():
         "restaurants_skipped": 0,
     }
     
+    # One timestamp for the whole run instead of a utcnow() call per record
+    batch_now = datetime.utcnow()
+    
     # Import hotels
     print("\n🏨 Importing Hotels...")
-    for hotel_data in hotels_data:
+    hotel_upserts = []
+    
+    async def process_hotel(hotel_data):
         try:
-            name_en = hotel_data.get('name', {}).get('en', '')
-            name_si = hotel_data.get('name', {}).get('si', '')
-            name_ta = hotel_data.get('name', {}).get('ta', '')
-            
             # Create multilingual content
-            name = MultilingualContent(
-                en=name_en,
-                si=name_si,
-                ta=name_ta
-            )
-            
-            desc_data = hotel_data.get('description', {})
-            description = MultilingualContent(
-                en=desc_data.get('en', ''),
-                si=desc_data.get('si', ''),
-                ta=desc_data.get('ta', '')
-            )
+            name = mlc(hotel_data.get('name'))
+            description = mlc(hotel_data.get('description'))
+            name_en = name.en
             
             # Create location
             loc_data = hotel_data.get('location', {})
@@ -114,76 +162,46 @@ async def import_data():
             # Get contact info
             contact_data = hotel_data.get('contact', {})
             
-            # Check if already exists
-            existing = await Hotel.find_one(Hotel.name.en == name_en)
+            hotel = Hotel(
+                name=name,
+                description=description,
+                location=location,
+                category=category,
+                rating=hotel_data.get('rating', 0.0),
+                price_range=hotel_data.get('price_range', {}),
+                amenities=hotel_data.get('amenities', []),
+                contact_phone=contact_data.get('phone'),
+                contact_email=contact_data.get('email'),
+                website=contact_data.get('website'),
+                room_count=hotel_data.get('room_count'),
+                check_in_time=hotel_data.get('check_in'),
+                check_out_time=hotel_data.get('check_out'),
+                is_active=hotel_data.get('is_active', True),
+            )
+            
+            # Update the existing record or create a new one in a single write
+            hotel_upserts.append(build_upsert(hotel, {"name.en": name_en}, batch_now))
+            
+            if len(hotel_upserts) >= BULK_WRITE_BATCH_SIZE:
+                await flush_upserts(Hotel, hotel_upserts, stats, "hotels")
             
-            if existing:
-                # Update existing record
-                existing.name = name
-                existing.description = description
-                existing.location = location
-                existing.category = category
-                existing.rating = hotel_data.get('rating', 0.0)
-                existing.price_range = hotel_data.get('price_range', {})
-                existing.amenities = hotel_data.get('amenities', [])
-                existing.contact_phone = contact_data.get('phone')
-                existing.contact_email = contact_data.get('email')
-                existing.website = contact_data.get('website')
-                existing.room_count = hotel_data.get('room_count')
-                existing.check_in_time = hotel_data.get('check_in')
-                existing.check_out_time = hotel_data.get('check_out')
-                existing.is_active = hotel_data.get('is_active', True)
-                existing.updated_at = datetime.utcnow()
-                await existing.save()
-                stats["hotels_updated"] += 1
-                print(f"  🔄 Updated: {name_en}")
-            else:
-                # Create new record
-                hotel = Hotel(
-                    name=name,
-                    description=description,
-                    location=location,
-                    category=category,
-                    rating=hotel_data.get('rating', 0.0),
-                    price_range=hotel_data.get('price_range', {}),
-                    amenities=hotel_data.get('amenities', []),
-                    contact_phone=contact_data.get('phone'),
-                    contact_email=contact_data.get('email'),
-                    website=contact_data.get('website'),
-                    room_count=hotel_data.get('room_count'),
-                    check_in_time=hotel_data.get('check_in'),
-                    check_out_time=hotel_data.get('check_out'),
-                    is_active=hotel_data.get('is_active', True),
-                )
-                await hotel.insert()
-                stats["hotels_created"] += 1
-                print(f"  ✅ Created: {name_en}")
-                
         except Exception as e:
-            print(f"  ❌ Error processing {hotel_data.get('name', {}).get('en', 'Unknown')}: {e}")
+            logger.error("Error processing %s: %s", hotel_data.get('name', {}).get('en', 'Unknown'), e)
             stats["hotels_skipped"] += 1
     
+    hotel_count = await run_pipeline(stream_json_items(json_file, 'hotels.item', 'hotels'), process_hotel)
+    await flush_upserts(Hotel, hotel_upserts, stats, "hotels")
+    
     # Import restaurants
     print("\n🍽️  Importing Restaurants...")
-    for rest_data in restaurants_data:
+    restaurant_upserts = []
+    
+    async def process_restaurant(rest_data):
         try:
-            name_en = rest_data.get('name', {}).get('en', '')
-            name_si = rest_data.get('name', {}).get('si', '')
-            name_ta = rest_data.get('name', {}).get('ta', '')
-            
             # Create multilingual content
-            name = MultilingualContent(
-                en=name_en,
-                si=name_si,
-                ta=name_ta
-            )
-            
-            desc_data = rest_data.get('description', {})
-            description = MultilingualContent(
-                en=desc_data.get('en', ''),
-                si=desc_data.get('si', ''),
-                ta=desc_data.get('ta', '')
-            )
+            name = mlc(rest_data.get('name'))
+            description = mlc(rest_data.get('description'))
+            name_en = name.en
             
             # Create location
             loc_data = rest_data.get('location', {})
@@ -199,88 +217,62 @@ async def import_data():
                 ]
             )
             
-            # Get cuisine types
+            # Get cuisine types (CuisineType has no catch-all member, so unknown ones are dropped)
             cuisine_types_str = rest_data.get('cuisine', [])
-            cuisine_types = []
-            for cuisine in cuisine_types_str:
-                # Try to map to CuisineType enum
-                try:
-                    cuisine_types.append(CuisineType[cuisine.upper().replace(' ', '_')])
-                except:
-                    # If not found, use OTHER
-                    cuisine_types.append(CuisineType.OTHER)
-            
-            if not cuisine_types:
-                cuisine_types = [CuisineType.OTHER]
+            cuisine_types = [
+                CUISINE_BY_NAME[key]
+                for key in map(enum_key, cuisine_types_str)
+                if key in CUISINE_BY_NAME
+            ]
             
             # Get price range
             price_range_str = rest_data.get('price_range', 'moderate')
-            try:
-                price_range = PriceRange[price_range_str.upper()]
-            except:
-                price_range = PriceRange.MODERATE
+            price_range = PRICE_RANGE_BY_NAME.get(price_range_str.upper(), PriceRange.MODERATE)
             
             # Get contact info
             contact_data = rest_data.get('contact', {})
             
-            # Check if already exists
-            existing = await Restaurant.find_one(Restaurant.name.en == name_en)
+            restaurant = Restaurant(
+                name=name,
+                description=description,
+                location=location,
+                cuisine_types=cuisine_types,
+                price_range=price_range,
+                rating=rest_data.get('rating', 0.0),
+                contact_phone=contact_data.get('phone'),
+                contact_email=contact_data.get('email'),
+                website=contact_data.get('website'),
+                seating_capacity=rest_data.get('seating_capacity'),
+                has_outdoor_seating=rest_data.get('outdoor_seating', False),
+                has_delivery=rest_data.get('delivery', False),
+                has_takeaway=rest_data.get('takeaway', False),
+                is_active=rest_data.get('is_active', True),
+            )
+            
+            # Update the existing record or create a new one in a single write
+            restaurant_upserts.append(build_upsert(restaurant, {"name.en": name_en}, batch_now))
+            
+            if len(restaurant_upserts) >= BULK_WRITE_BATCH_SIZE:
+                await flush_upserts(Restaurant, restaurant_upserts, stats, "restaurants")
             
-            if existing:
-                # Update existing record
-                existing.name = name
-                existing.description = description
-                existing.location = location
-                existing.cuisine_types = cuisine_types
-                existing.price_range = price_range
-                existing.rating = rest_data.get('rating', 0.0)
-                existing.contact_phone = contact_data.get('phone')
-                existing.contact_email = contact_data.get('email')
-                existing.website = contact_data.get('website')
-                existing.seating_capacity = rest_data.get('seating_capacity')
-                existing.has_outdoor_seating = rest_data.get('outdoor_seating', False)
-                existing.has_delivery = rest_data.get('delivery', False)
-                existing.has_takeaway = rest_data.get('takeaway', False)
-                existing.is_active = rest_data.get('is_active', True)
-                existing.updated_at = datetime.utcnow()
-                await existing.save()
-                stats["restaurants_updated"] += 1
-                print(f"  🔄 Updated: {name_en}")
-            else:
-                # Create new record
-                restaurant = Restaurant(
-                    name=name,
-                    description=description,
-                    location=location,
-                    cuisine_types=cuisine_types,
-                    price_range=price_range,
-                    rating=rest_data.get('rating', 0.0),
-                    contact_phone=contact_data.get('phone'),
-                    contact_email=contact_data.get('email'),
-                    website=contact_data.get('website'),
-                    seating_capacity=rest_data.get('seating_capacity'),
-                    has_outdoor_seating=rest_data.get('outdoor_seating', False),
-                    has_delivery=rest_data.get('delivery', False),
-                    has_takeaway=rest_data.get('takeaway', False),
-                    is_active=rest_data.get('is_active', True),
-                )
-                await restaurant.insert()
-                stats["restaurants_created"] += 1
-                print(f"  ✅ Created: {name_en}")
-                
         except Exception as e:
-            print(f"  ❌ Error processing {rest_data.get('name', {}).get('en', 'Unknown')}: {e}")
+            logger.error("Error processing %s: %s", rest_data.get('name', {}).get('en', 'Unknown'), e)
             stats["restaurants_skipped"] += 1
     
+    restaurant_count = await run_pipeline(
+        stream_json_items(json_file, 'restaurants.item', 'restaurants'), process_restaurant
+    )
+    await flush_upserts(Restaurant, restaurant_upserts, stats, "restaurants")
+    
     # Print summary
     print("\n" + "=" * 50)
     print("📊 IMPORT SUMMARY")
     print("=" * 50)
-    print(f"  Hotels:")
+    print(f"  Hotels ({hotel_count} processed):")
     print(f"    Created: {stats['hotels_created']}")
     print(f"    Updated: {stats['hotels_updated']}")
     print(f"    Skipped: {stats['hotels_skipped']}")
-    print(f"  Restaurants:")
+    print(f"  Restaurants ({restaurant_count} processed):")
     print(f"    Created: {stats['restaurants_created']}")
     print(f"    Updated: {stats['restaurants_updated']}")
     print(f"    Skipped: {stats['restaurants_skipped']}")
@@ -3,10 +3,13 @@ Import master_database.json into MongoDB
 Maps simple JSON structure to appropriate model collections
 """
 
+import re
 import sys
-import json
 import asyncio
+import logging
+from functools import lru_cache
 from pathlib import Path
+from datetime import datetime
 from typing import Dict, List
 
 # Add parent directory to path
@@ -14,6 +17,7 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from motor.motor_asyncio import AsyncIOMotorClient
 from beanie import init_beanie
+from pymongo import UpdateOne
 
 from backend.app.core.config import settings
 from backend.app.models.attraction import (
@@ -25,6 +29,13 @@ from backend.app.models.hotel import (
 from backend.app.models.restaurant import (
     Restaurant, Location as RestaurantLocation, MultilingualContent as RestaurantMultilingualContent
 )
+from scripts._bulk_import import (
+    BULK_IMPORT_CLIENT_OPTIONS, BULK_WRITE_BATCH_SIZE, build_insert_if_missing, dump_fields,
+    ensure_lookup_indexes, flush_upserts as bulk_flush, run_pipeline, stream_json_items
+)
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s %(message)s')
+logger = logging.getLogger(__name__)
 
 
 # Category mapping from master_database.json to model categories
@@ -47,40 +58,64 @@ CATEGORY_MAP = {
 }
 
 
+# Default [longitude, latitude] (Sri Lanka center) for items without coordinates
+DEFAULT_COORDINATES = (80.0, 7.0)
+
+# Slug patterns: drop punctuation, then collapse whitespace/dash runs
+SLUG_STRIP_PATTERN = re.compile(r'[^\w\s-]')
+SLUG_DASH_PATTERN = re.compile(r'[-\s]+')
+
+# Indexes behind the slug lookups of the upserts
+LOOKUP_INDEXES = (
+    (Attraction, "slug", True),
+    (Hotel, "name.en", False),
+    (Hotel, "slug", True),
+    (Restaurant, "name.en", False),
+    (Restaurant, "slug", True),
+)
+
+
 def normalize_category(category: str) -> tuple:
     """Normalize category from master database to model type and category"""
     return CATEGORY_MAP.get(category, ("attraction", AttractionCategory.NATURE))
 
 
+@lru_cache(maxsize=8192)
 def create_slug(name: str) -> str:
     """Create URL-friendly slug from name"""
-    import re
-    slug = name.lower()
-    slug = re.sub(r'[^\w\s-]', '', slug)
-    slug = re.sub(r'[-\s]+', '-', slug)
+    slug = SLUG_STRIP_PATTERN.sub('', name.lower())
+    slug = SLUG_DASH_PATTERN.sub('-', slug)
     return slug.strip('-')
 
 
+async def load_existing_slugs(model) -> set:
+    """Fetch every slug already stored for model in one projected scan"""
+    cursor = model.get_motor_collection().find({}, {"slug": 1, "_id": 0})
+    return {doc["slug"] async for doc in cursor if "slug" in doc}
+
+
+async def flush_upserts(model, operations: List[UpdateOne], stats: Dict, kind: str):
+    """Send pending upserts and record imported/skipped/error counts"""
+    upserted, matched, failed = await bulk_flush(model, operations)
+    stats[kind] += upserted
+    stats["skipped"] += matched  # Already exist
+    stats["errors"] += failed
+
+
 async def import_data():
     """Import data from master_database.json"""
     
-    # Load JSON data
     json_path = Path(__file__).parent.parent / "master_database.json"
-    print(f"Loading data from {json_path}...")
-    
-    with open(json_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    print(f"Loaded {len(data)} items from master_database.json")
     
     # Initialize database connection
     print("Connecting to MongoDB...")
-    client = AsyncIOMotorClient(settings.MONGODB_URL)
+    client = AsyncIOMotorClient(settings.MONGODB_URL, **BULK_IMPORT_CLIENT_OPTIONS)
     
     await init_beanie(
         database=client[settings.DATABASE_NAME],
         document_models=[Attraction, Hotel, Restaurant]
     )
+    await ensure_lookup_indexes(LOOKUP_INDEXES)
     print("Connected to MongoDB!")
     
     # Statistics
@@ -92,7 +127,29 @@ async def import_data():
         "errors": 0
     }
     
-    for idx, item in enumerate(data, 1):
+    # Pending upserts per collection
+    attraction_upserts: List[UpdateOne] = []
+    hotel_upserts: List[UpdateOne] = []
+    restaurant_upserts: List[UpdateOne] = []
+    
+    # One timestamp for the whole run instead of a utcnow() call per item
+    batch_now = datetime.utcnow()
+    
+    # Slugs already in each collection (plus those queued during this run) so
+    # existing and repeated items are skipped without a database round-trip
+    attraction_slugs, hotel_slugs, restaurant_slugs = await asyncio.gather(
+        load_existing_slugs(Attraction),
+        load_existing_slugs(Hotel),
+        load_existing_slugs(Restaurant),
+    )
+    known_slugs = {
+        "attraction": attraction_slugs,
+        "hotel": hotel_slugs,
+        "restaurant": restaurant_slugs,
+    }
+    
+    async def process_item(entry):
+        idx, item = entry
         try:
             name_en = item.get("name_en", "Unknown")
             name_si = item.get("name_si", "")
@@ -105,11 +162,18 @@ async def import_data():
             # Skip if essential data missing
             if not name_en or not category:
                 stats["skipped"] += 1
-                continue
+                return
             
             # Determine collection type and category
             collection_type, model_category = normalize_category(category)
             
+            # Skip items whose slug is already stored or queued
+            slug = create_slug(name_en)
+            seen_slugs = known_slugs[collection_type]
+            if slug in seen_slugs:
+                stats["skipped"] += 1
+                return
+            
             # Create multilingual content
             multilingual_name = MultilingualContent(
                 en=name_en,
@@ -135,19 +199,11 @@ async def import_data():
                 address=city,
                 city=city,
                 province="",
-                coordinates=coordinates if len(coordinates) == 2 else [80.0, 7.0]  # Default Sri Lanka center
+                coordinates=coordinates if len(coordinates) == 2 else DEFAULT_COORDINATES
             )
             
-            # Create slug
-            slug = create_slug(name_en)
-            
-            # Insert based on collection type
+            # Queue an insert-if-missing keyed on slug for the target collection
             if collection_type == "attraction":
-                # Check if exists
-                exists = await Attraction.find_one(Attraction.slug == slug)
-                if exists:
-                    continue
-                
                 attraction = Attraction(
                     name=multilingual_name,
                     description=multilingual_description,
@@ -159,15 +215,13 @@ async def import_data():
                     is_active=True,
                     is_featured=False
                 )
-                await attraction.insert()
-                stats["attractions"] += 1
+                attraction_upserts.append(build_insert_if_missing(dump_fields(attraction), {"slug": slug}, batch_now))
+                # Only a queued item claims its slug; one that failed validation must not block later ones
+                seen_slugs.add(slug)
+                if len(attraction_upserts) >= BULK_WRITE_BATCH_SIZE:
+                    await flush_upserts(Attraction, attraction_upserts, stats, "attractions")
                 
             elif collection_type == "hotel":
-                # Check if exists
-                exists = await Hotel.find_one(Hotel.slug == slug)
-                if exists:
-                    continue
-                
                 hotel = Hotel(
                     name=multilingual_name,
                     description=multilingual_description,
@@ -179,15 +233,12 @@ async def import_data():
                     is_featured=False,
                     rooms=[]
                 )
-                await hotel.insert()
-                stats["hotels"] += 1
+                hotel_upserts.append(build_insert_if_missing(dump_fields(hotel), {"slug": slug}, batch_now))
+                seen_slugs.add(slug)
+                if len(hotel_upserts) >= BULK_WRITE_BATCH_SIZE:
+                    await flush_upserts(Hotel, hotel_upserts, stats, "hotels")
                 
             elif collection_type == "restaurant":
-                # Check if exists
-                exists = await Restaurant.find_one(Restaurant.slug == slug)
-                if exists:
-                    continue
-                
                 restaurant = Restaurant(
                     name=multilingual_name,
                     description=multilingual_description,
@@ -199,17 +250,32 @@ async def import_data():
                     cuisine_types=[],
                     menu_items=[]
                 )
-                await restaurant.insert()
-                stats["restaurants"] += 1
-            
-            # Progress indicator
-            if idx % 100 == 0:
-                print(f"Processed {idx}/{len(data)} items...")
+                restaurant_upserts.append(build_insert_if_missing(dump_fields(restaurant), {"slug": slug}, batch_now))
+                seen_slugs.add(slug)
+                if len(restaurant_upserts) >= BULK_WRITE_BATCH_SIZE:
+                    await flush_upserts(Restaurant, restaurant_upserts, stats, "restaurants")
                 
         except Exception as e:
-            print(f"Error processing item {idx} ({name_en}): {str(e)}")
+            logger.error("Error processing item %d (%s): %s", idx, item.get('name_en', 'Unknown'), e)
             stats["errors"] += 1
-            continue
+    
+    # Stream items from disk instead of loading the whole file; one producer
+    # parses while the consumers build documents and write batches
+    print(f"Streaming data from {json_path}...")
+    
+    async def numbered_items():
+        idx = 0
+        async for item in stream_json_items(json_path, 'item', 'items'):
+            idx += 1
+            yield idx, item
+    
+    total = await run_pipeline(numbered_items(), process_item)
+    
+    await asyncio.gather(
+        flush_upserts(Attraction, attraction_upserts, stats, "attractions"),
+        flush_upserts(Hotel, hotel_upserts, stats, "hotels"),
+        flush_upserts(Restaurant, restaurant_upserts, stats, "restaurants"),
+    )
     
     # Print statistics
     print("\n" + "="*50)
@@ -220,7 +286,7 @@ async def import_data():
     print(f"Restaurants imported: {stats['restaurants']}")
     print(f"Skipped: {stats['skipped']}")
     print(f"Errors: {stats['errors']}")
-    print(f"Total: {len(data)}")
+    print(f"Total: {total}")
     print("="*50)
 
 
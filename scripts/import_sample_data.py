@@ -6,7 +6,6 @@ Imports the sample data generated by generate_sample_data.py
 """
 
 import asyncio
-import json
 import sys
 from pathlib import Path
 
@@ -19,6 +18,7 @@ from backend.app.models.emergency import Emergency
 from backend.app.models.hotel import Hotel
 from backend.app.models.restaurant import Restaurant
 from backend.app.models.event import Event
+from scripts._bulk_import import load_json
 
 
 async def import_data():
@@ -44,8 +44,7 @@ async def import_data():
         return
     
     try:
-        with open(data_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_json(data_file)
         print(f"✅ Loaded data from: {data_file}\n")
     except Exception as e:
         print(f"❌ Failed to load data: {e}")
@@ -2,14 +2,19 @@
 Import THASL Hotels Data into MongoDB
 ======================================
 
-Transforms and imports hotels from thasl_hotels.json into database
+Transforms and imports hotels from thasl_hotels.json into database.
+Documents are written as raw dicts; pass --validate to run each one
+through the Hotel model first.
 """
 
+import argparse
 import asyncio
-import json
+import logging
 import sys
 from pathlib import Path
+from typing import Final
 import re
+from datetime import datetime
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
@@ -17,6 +22,93 @@ sys.path.insert(0, str(project_root))
 
 from backend.app.core.database import init_database
 from backend.app.models.hotel import Hotel
+from scripts._bulk_import import (
+    BULK_WRITE_BATCH_SIZE, build_insert_if_missing, dump_fields, ensure_lookup_indexes,
+    flush_upserts, load_json, run_pipeline
+)
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s %(message)s')
+logger = logging.getLogger(__name__)
+
+# Classification keywords mapped to HotelCategory values; first match wins
+CATEGORY_KEYWORDS = (
+    ("boutique", "boutique"),
+    ("resort", "resort"),
+    ("ayurvedic", "resort"),
+    ("villa", "villa"),
+    ("guest", "guesthouse"),
+    ("rest house", "guesthouse"),
+    ("eco", "eco_lodge"),
+    ("apartment", "apartment"),
+    ("luxury", "luxury"),
+    ("business", "business"),
+)
+
+# Star rating written as a digit or a word, e.g. "5 star" or "five star"
+STAR_PATTERN = re.compile(r'\b([1-5]|one|two|three|four|five)\s*star')
+STAR_WORDS = {"one": "1", "two": "2", "three": "3", "four": "4", "five": "5"}
+
+# Default amenities by hotel size (more than 20 rooms counts as large)
+LARGE_HOTEL_AMENITIES = ("wifi", "parking", "restaurant")
+SMALL_HOTEL_AMENITIES = ("wifi",)
+
+# Common cities in Sri Lanka, in priority order when an address names several
+CITIES = [
+    "Colombo", "Kandy", "Galle", "Negombo", "Bentota", "Tangalle",
+    "Dambulla", "Nuwara Eliya", "Ella", "Trincomalee", "Jaffna",
+    "Hikkaduwa", "Unawatuna", "Mirissa", "Arugam Bay", "Anuradhapura",
+    "Polonnaruwa", "Sigiriya", "Matara", "Badulla", "Ratnapura",
+    "Kalutara", "Beruwala", "Ahungalla", "Koggala", "Weligama"
+]
+CITY_PATTERN = re.compile(
+    r'\b(?:' + '|'.join(re.escape(city) for city in CITIES) + r')\b',
+    re.IGNORECASE
+)
+
+# Fallback city per province; compound names come first so "North Western"
+# is not claimed by "Western"
+PROVINCE_CITY = {
+    "North Western": "Kurunegala",
+    "North Central": "Anuradhapura",
+    "Western": "Colombo",
+    "Southern": "Galle",
+    "Central": "Kandy",
+    "Northern": "Jaffna",
+    "Eastern": "Trincomalee",
+    "Sabaragamuwa": "Ratnapura",
+    "Uva": "Badulla",
+}
+
+# Approximate coordinates per city, keyed on the lower-cased city name
+CITY_COORDINATES: Final = {
+    "colombo": (6.9271, 79.8612),
+    "kandy": (7.2906, 80.6337),
+    "galle": (6.0535, 80.2210),
+    "negombo": (7.2094, 79.8358),
+    "bentota": (6.4256, 79.9956),
+    "tangalle": (6.0235, 80.7958),
+    "dambulla": (7.8600, 80.6515),
+    "nuwara eliya": (6.9497, 80.7891),
+    "ella": (6.8667, 81.0467),
+    "trincomalee": (8.5874, 81.2152),
+    "hikkaduwa": (6.1408, 80.1000),
+    "unawatuna": (6.0100, 80.2480),
+    "mirissa": (5.9463, 80.4500),
+    "sigiriya": (7.9565, 80.7597),
+    "anuradhapura": (8.3114, 80.4037),
+}
+
+# Default center of Sri Lanka
+DEFAULT_COORDINATES: Final = (7.8731, 80.7718)
+
+# Slug character map: spaces become dashes, brackets and dots are dropped
+SLUG_TRANSLATION = str.maketrans({" ": "-", "(": None, ")": None, ".": None})
+
+# Indexes behind the name.en lookups of the upserts
+LOOKUP_INDEXES = (
+    (Hotel, "name.en", False),
+    (Hotel, "slug", True),
+)
 
 
 def clean_phone(phone_str):
@@ -34,108 +126,38 @@ def clean_phone(phone_str):
     return phone
 
 
-def determine_category(classification):
-    """Map classification to HotelCategory enum"""
-    classification = classification.lower()
+def classify(classification_lower):
+    """Map a lower-cased classification to (HotelCategory value, star rating)"""
+    category = next(
+        (value for keyword, value in CATEGORY_KEYWORDS if keyword in classification_lower),
+        "resort"  # default
+    )
     
-    if "boutique" in classification:
-        return "boutique"
-    elif "resort" in classification or "ayurvedic" in classification:
-        return "resort"
-    elif "villa" in classification:
-        return "villa"
-    elif "guest" in classification or "rest house" in classification:
-        return "guesthouse"
-    elif "eco" in classification:
-        return "eco_lodge"
-    elif "apartment" in classification:
-        return "apartment"
-    elif "luxury" in classification:
-        return "luxury"
-    elif "business" in classification:
-        return "business"
-    else:
-        return "resort"  # default
-
-
-def determine_star_rating(classification):
-    """Extract star rating from classification"""
-    classification = classification.lower()
+    match = STAR_PATTERN.search(classification_lower)
+    star_rating = STAR_WORDS.get(match.group(1), match.group(1)) if match else "unrated"
     
-    if "5 star" in classification or "five star" in classification:
-        return "5"
-    elif "4 star" in classification or "four star" in classification:
-        return "4"
-    elif "3 star" in classification or "three star" in classification:
-        return "3"
-    elif "2 star" in classification or "two star" in classification:
-        return "2"
-    elif "1 star" in classification or "one star" in classification:
-        return "1"
-    else:
-        return "unrated"
+    return category, star_rating
 
 
 def extract_city(address, province):
     """Extract city from address"""
-    # Common cities in Sri Lanka
-    cities = [
-        "Colombo", "Kandy", "Galle", "Negombo", "Bentota", "Tangalle",
-        "Dambulla", "Nuwara Eliya", "Ella", "Trincomalee", "Jaffna",
-        "Hikkaduwa", "Unawatuna", "Mirissa", "Arugam Bay", "Anuradhapura",
-        "Polonnaruwa", "Sigiriya", "Matara", "Badulla", "Ratnapura",
-        "Kalutara", "Beruwala", "Ahungalla", "Koggala", "Weligama"
-    ]
-    
-    address_upper = address.upper()
-    for city in cities:
-        if city.upper() in address_upper:
+    # Collect every known city named in the address in one scan, then pick by list priority
+    found = {match.group(0).lower() for match in CITY_PATTERN.finditer(address)}
+    for city in CITIES:
+        if city.lower() in found:
             return city
     
     # Extract from province if not found in address
-    if "Western" in province:
-        return "Colombo"
-    elif "Southern" in province:
-        return "Galle"
-    elif "Central" in province:
-        return "Kandy"
-    elif "Northern" in province:
-        return "Jaffna"
-    elif "Eastern" in province:
-        return "Trincomalee"
-    elif "North Central" in province:
-        return "Anuradhapura"
-    elif "North Western" in province:
-        return "Kurunegala"
-    elif "Sabaragamuwa" in province:
-        return "Ratnapura"
-    elif "Uva" in province:
-        return "Badulla"
+    for province_name, city in PROVINCE_CITY.items():
+        if province_name in province:
+            return city
     
     return "Sri Lanka"
 
 
 def parse_coordinates(city):
     """Get approximate coordinates for city"""
-    coords_map = {
-        "Colombo": [6.9271, 79.8612],
-        "Kandy": [7.2906, 80.6337],
-        "Galle": [6.0535, 80.2210],
-        "Negombo": [7.2094, 79.8358],
-        "Bentota": [6.4256, 79.9956],
-        "Tangalle": [6.0235, 80.7958],
-        "Dambulla": [7.8600, 80.6515],
-        "Nuwara Eliya": [6.9497, 80.7891],
-        "Ella": [6.8667, 81.0467],
-        "Trincomalee": [8.5874, 81.2152],
-        "Hikkaduwa": [6.1408, 80.1000],
-        "Unawatuna": [6.0100, 80.2480],
-        "Mirissa": [5.9463, 80.4500],
-        "Sigiriya": [7.9565, 80.7597],
-        "Anuradhapura": [8.3114, 80.4037],
-    }
-    
-    return coords_map.get(city, [7.8731, 80.7718])  # Default center of Sri Lanka
+    return CITY_COORDINATES.get(city.lower(), DEFAULT_COORDINATES)
 
 
 def transform_hotel(hotel_data):
@@ -143,6 +165,7 @@ def transform_hotel(hotel_data):
     
     name = hotel_data["name"].title()
     classification = hotel_data.get("classification", "Hotel")
+    classification_lower = classification.lower()
     address = hotel_data.get("address", "")
     province = hotel_data.get("province", "")
     
@@ -167,8 +190,7 @@ def transform_hotel(hotel_data):
         website = None
     
     # Category and rating
-    category = determine_category(classification)
-    star_rating = determine_star_rating(classification)
+    category, star_rating = classify(classification_lower)
     
     # Number of rooms
     try:
@@ -184,9 +206,9 @@ def transform_hotel(hotel_data):
             "ta": name
         },
         "description": {
-            "en": f"{name} is a {classification.lower()} located in {city}, Sri Lanka. {classification} offering comfortable accommodation with excellent service.",
-            "si": f"{name} {city} හි පිහිටි {classification.lower()} ය.",
-            "ta": f"{name} {city} இல் அமைந்துள்ள {classification.lower()} ஆகும்."
+            "en": f"{name} is a {classification_lower} located in {city}, Sri Lanka. {classification} offering comfortable accommodation with excellent service.",
+            "si": f"{name} {city} හි පිහිටි {classification_lower} ය.",
+            "ta": f"{name} {city} இல் அமைந்துள்ள {classification_lower} ஆகும்."
         },
         "short_description": {
             "en": f"{classification} in {city}",
@@ -205,10 +227,10 @@ def transform_hotel(hotel_data):
         "email": email,
         "website": website,
         "total_rooms": total_rooms,
-        "slug": name.lower().replace(" ", "-").replace("(", "").replace(")", "").replace(".", ""),
+        "slug": name.lower().translate(SLUG_TRANSLATION),
         "is_active": True,
         "popularity_score": 50,  # Default
-        "amenities": ["wifi", "parking", "restaurant"] if total_rooms > 20 else ["wifi"],
+        "amenities": LARGE_HOTEL_AMENITIES if total_rooms > 20 else SMALL_HOTEL_AMENITIES,
         "images": [],
         "rooms": []
     }
@@ -216,7 +238,19 @@ def transform_hotel(hotel_data):
     return hotel_doc
 
 
-async def import_hotels():
+async def load_existing_names() -> set:
+    """Fetch every stored hotel's English name in one projected scan"""
+    cursor = Hotel.get_motor_collection().find({}, {"name.en": 1, "_id": 0})
+    return {doc["name"]["en"] async for doc in cursor if "en" in doc.get("name", {})}
+
+
+async def iter_hotels(hotels_data):
+    """Yield the loaded hotels as the pipeline source"""
+    for hotel_data in hotels_data:
+        yield hotel_data
+
+
+async def import_hotels(validate=False):
     """Import hotels into database"""
     
     print("\nImporting THASL Hotels Data")
@@ -225,6 +259,7 @@ async def import_hotels():
     # Initialize database
     try:
         await init_database()
+        await ensure_lookup_indexes(LOOKUP_INDEXES)
         print("[OK] Database connection established\n")
     except Exception as e:
         print(f"[ERROR] Failed to connect to database: {e}")
@@ -238,8 +273,7 @@ async def import_hotels():
         return
     
     try:
-        with open(data_file, 'r', encoding='utf-8') as f:
-            hotels_data = json.load(f)
+        hotels_data = load_json(data_file)
         print(f"[OK] Loaded {len(hotels_data)} hotels from file\n")
     except Exception as e:
         print(f"[ERROR] Failed to load data: {e}")
@@ -253,31 +287,51 @@ async def import_hotels():
     print("Processing hotels...")
     print("-" * 60)
     
-    for hotel_data in hotels_data:
+    # One timestamp for the whole run instead of a utcnow() call per hotel
+    batch_now = datetime.utcnow()
+    
+    upserts = []
+    
+    # Names already stored (plus those queued during this run) so existing
+    # and repeated hotels are skipped without a database round-trip
+    known_names = await load_existing_names()
+    
+    async def flush():
+        nonlocal imported, skipped, errors
+        inserted, existing, failed = await flush_upserts(Hotel, upserts)
+        imported += inserted
+        skipped += existing
+        errors += failed
+        logger.info("Imported %d hotels", imported)
+    
+    async def process_hotel(hotel_data):
+        nonlocal skipped, errors
         try:
-            # Transform data
             hotel_doc = transform_hotel(hotel_data)
             
-            # Check if already exists
-            existing = await Hotel.find_one(
-                Hotel.name.en == hotel_doc["name"]["en"]
-            )
+            # The transformed dict is trusted; --validate checks it against the model
+            if validate:
+                hotel_doc = dump_fields(Hotel(**hotel_doc))
             
-            if existing:
+            # Skip hotels whose name is already stored or queued
+            name_en = hotel_doc["name"]["en"]
+            if name_en in known_names:
                 skipped += 1
-                continue
+                return
+            known_names.add(name_en)
             
-            # Create hotel
-            hotel = Hotel(**hotel_doc)
-            await hotel.save()
-            imported += 1
+            # Insert-if-missing still guards against writes from concurrent runs
+            upserts.append(build_insert_if_missing(hotel_doc, {"name.en": name_en}, batch_now))
             
-            if imported % 10 == 0:
-                print(f"  [OK] Imported {imported} hotels...")
+            if len(upserts) >= BULK_WRITE_BATCH_SIZE:
+                await flush()
             
         except Exception as e:
             errors += 1
-            print(f"  [ERROR] Error importing {hotel_data.get('name', 'Unknown')}: {str(e)[:100]}")
+            logger.error("Error importing %s: %s", hotel_data.get('name', 'Unknown'), str(e)[:100])
+    
+    await run_pipeline(iter_hotels(hotels_data), process_hotel)
+    await flush()
     
     # Summary
     print("\n" + "=" * 60)
@@ -297,4 +351,11 @@ async def import_hotels():
 
 
 if __name__ == "__main__":
-    asyncio.run(import_hotels())
+    parser = argparse.ArgumentParser(description="Import THASL hotels into MongoDB")
+    parser.add_argument(
+        "--validate",
+        action="store_true",
+        help="validate each hotel against the Hotel model before writing (slower)"
+    )
+    args = parser.parse_args()
+    asyncio.run(import_hotels(validate=args.validate))
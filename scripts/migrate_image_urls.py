@@ -3,6 +3,7 @@ Database Migration Script: Fix Image URL Format
 Converts image URLs from dict format {'_url': 'https://...'} to string format 'https://...'
 """
 
+import ast
 import asyncio
 import sys
 from pathlib import Path
@@ -16,15 +17,40 @@ from backend.app.models.attraction import Attraction
 from backend.app.models.hotel import Hotel
 from backend.app.models.restaurant import Restaurant
 from backend.app.models.event import Event
+from pymongo import UpdateOne
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Number of fixed documents sent per bulk_write call
+BULK_WRITE_BATCH_SIZE = 500
+
+# Documents fetched per cursor round trip (the server default is 101)
+CURSOR_BATCH_SIZE = 1000
+
+# Single-URL fields that should hold plain strings
+URL_FIELDS = ('image_url', 'photo_url', 'thumbnail_url', 'cover_image')
+
+# Only documents with a dict-wrapped URL somewhere need fixing
+NEEDS_FIX_FILTER = {
+    "$or": [
+        {"images._url": {"$exists": True}},
+        {"images.url._url": {"$exists": True}},
+        # str()-ed image dicts such as "{'_url': 'https://...'}"
+        {"images": {"$regex": "^\\{"}},
+        *({field_name: {"$type": "object"}} for field_name in URL_FIELDS),
+    ]
+}
+
+# Fetch just the fields the migration reads (plus _id)
+MIGRATION_PROJECTION = {"images": 1, **{field_name: 1 for field_name in URL_FIELDS}}
+
 
 def fix_image_dict(img_dict):
     """Convert image dict to proper AttractionImage format"""
-    if isinstance(img_dict, str):
+    img_type = type(img_dict)
+    if img_type is str:
         # If it's already a string URL, convert to dict format
         return {
             'url': img_dict,
@@ -32,17 +58,20 @@ def fix_image_dict(img_dict):
             'is_primary': False,
             'order': 0
         }
-    elif isinstance(img_dict, dict):
+    
+    if img_type is dict:
         # Extract URL from various formats
-        url = None
         if '_url' in img_dict:
             url = img_dict['_url']
-        elif 'url' in img_dict:
-            url_value = img_dict['url']
-            if isinstance(url_value, dict) and '_url' in url_value:
-                url = url_value['_url']
-            elif isinstance(url_value, str):
+        else:
+            url_value = img_dict.get('url')
+            url_type = type(url_value)
+            if url_type is dict:
+                url = url_value.get('_url')
+            elif url_type is str:
                 url = url_value
+            else:
+                url = None
         
         if url:
             # Return proper AttractionImage format
@@ -58,6 +87,96 @@ def fix_image_dict(img_dict):
     return img_dict
 
 
+def unwrap_stringified_image(img):
+    """Turn a str()-ed image dict back into a dict; anything else is returned unchanged"""
+    if type(img) is str and img.startswith('{'):
+        try:
+            parsed = ast.literal_eval(img)
+        except (ValueError, SyntaxError):
+            return img
+        if type(parsed) is dict:
+            return parsed
+    return img
+
+
+def needs_image_fix(img):
+    """Whether an images entry is a dict wrapping its URL in '_url', directly or under 'url'"""
+    if type(img) is not dict:
+        return False
+    if '_url' in img:
+        return True
+    url_value = img.get('url')
+    return type(url_value) is dict and '_url' in url_value
+
+
+async def migrate_collection(collection_name, Model):
+    """Fix image URLs in one collection; returns the number of documents fixed"""
+    logger.info(f"Processing {collection_name}...")
+    fixed_count = 0
+    
+    # Use raw MongoDB collection to avoid Pydantic validation
+    # Separate name so the label used in the log lines is not shadowed
+    db_collection_name = Model.get_collection_name()
+    collection = db.database[db_collection_name]
+    pending = []
+    
+    # Find candidate documents with raw cursor, fetching large batches
+    cursor = collection.find(NEEDS_FIX_FILTER, MIGRATION_PROJECTION).batch_size(CURSOR_BATCH_SIZE)
+    async for raw_doc in cursor:
+        doc_id = raw_doc.get("_id")
+        updated = False
+        update_fields = {}
+        
+        # Check images field
+        if 'images' in raw_doc and raw_doc['images']:
+            fixed_images = []
+            for img in raw_doc['images']:
+                candidate = unwrap_stringified_image(img)
+                if needs_image_fix(candidate):
+                    fixed_img = fix_image_dict(candidate)
+                    if fixed_img != img:
+                        updated = True
+                    fixed_images.append(fixed_img)
+                else:
+                    fixed_images.append(img)
+            
+            if updated:
+                update_fields['images'] = fixed_images
+        
+        # Check individual image fields (these are usually strings, not AttractionImage objects)
+        for field_name in URL_FIELDS:
+            if field_name in raw_doc:
+                field_value = raw_doc[field_name]
+                if isinstance(field_value, dict):
+                    # Extract URL from dict
+                    if '_url' in field_value:
+                        update_fields[field_name] = field_value['_url']
+                        updated = True
+                    elif 'url' in field_value:
+                        url_val = field_value['url']
+                        if isinstance(url_val, str):
+                            update_fields[field_name] = url_val
+                            updated = True
+                        elif isinstance(url_val, dict) and '_url' in url_val:
+                            update_fields[field_name] = url_val['_url']
+                            updated = True
+        
+        # Queue the update; fixes are written in batches
+        if updated and update_fields:
+            pending.append(UpdateOne({"_id": doc_id}, {"$set": update_fields}))
+            fixed_count += 1
+            
+            if len(pending) >= BULK_WRITE_BATCH_SIZE:
+                await collection.bulk_write(pending, ordered=False)
+                pending.clear()
+    
+    if pending:
+        await collection.bulk_write(pending, ordered=False)
+    
+    logger.info(f"Fixed {fixed_count} {collection_name} documents")
+    return fixed_count
+
+
 async def migrate_image_urls():
     """Migrate image URLs from dict to string format"""
     await init_database()
@@ -72,77 +191,13 @@ async def migrate_image_urls():
         ("events", Event),
     ]
     
-    total_fixed = 0
-    
-    for collection_name, Model in collections:
-        logger.info(f"Processing {collection_name}...")
-        fixed_count = 0
-        
-        # Use raw MongoDB collection to avoid Pydantic validation
-        collection_name = Model.get_collection_name()
-        collection = db.database[collection_name]
-        
-        # Find all documents with raw cursor
-        async for raw_doc in collection.find({}):
-            doc_id = raw_doc.get("_id")
-            updated = False
-            update_fields = {}
-            
-            # Check images field
-            if 'images' in raw_doc and raw_doc['images']:
-                fixed_images = []
-                for img in raw_doc['images']:
-                    # Check if image needs fixing
-                    needs_fix = False
-                    if isinstance(img, dict):
-                        # Check if it's a dict with _url or nested url dict
-                        if '_url' in img:
-                            needs_fix = True
-                        elif 'url' in img and isinstance(img['url'], dict) and '_url' in img['url']:
-                            needs_fix = True
-                        elif isinstance(img, str) and img.startswith("{'") and "'_url'" in img:
-                            # String representation of dict
-                            needs_fix = True
-                    
-                    if needs_fix:
-                        fixed_img = fix_image_dict(img)
-                        if fixed_img != img:
-                            updated = True
-                        fixed_images.append(fixed_img)
-                    else:
-                        fixed_images.append(img)
-                
-                if updated:
-                    update_fields['images'] = fixed_images
-            
-            # Check individual image fields (these are usually strings, not AttractionImage objects)
-            for field_name in ['image_url', 'photo_url', 'thumbnail_url', 'cover_image']:
-                if field_name in raw_doc:
-                    field_value = raw_doc[field_name]
-                    if isinstance(field_value, dict):
-                        # Extract URL from dict
-                        if '_url' in field_value:
-                            update_fields[field_name] = field_value['_url']
-                            updated = True
-                        elif 'url' in field_value:
-                            url_val = field_value['url']
-                            if isinstance(url_val, str):
-                                update_fields[field_name] = url_val
-                                updated = True
-                            elif isinstance(url_val, dict) and '_url' in url_val:
-                                update_fields[field_name] = url_val['_url']
-                                updated = True
-            
-            # Update document if needed
-            if updated and update_fields:
-                await collection.update_one(
-                    {"_id": doc_id},
-                    {"$set": update_fields}
-                )
-                fixed_count += 1
-                total_fixed += 1
-        
-        logger.info(f"Fixed {fixed_count} {collection_name} documents")
+    # Collections are independent, so their scans and writes run concurrently
+    async with asyncio.TaskGroup() as tg:
+        tasks = [
+            tg.create_task(migrate_collection(collection_name, Model))
+            for collection_name, Model in collections
+        ]
+    total_fixed = sum(task.result() for task in tasks)
     
     logger.info(f"Migration complete! Fixed {total_fixed} documents total.")
     return total_fixed
@@ -12,10 +12,26 @@ Validates all JSON databases for:
 """
 
 import json
+import mmap
 import os
-from typing import Dict, List, Any, Tuple
+import re
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, Iterator, Tuple
 from collections import defaultdict
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+except ImportError:
+    # Reported when a file is first streamed, so --help and imports still work
+    ijson = None
+
 # Sri Lanka geographic bounds
 SRI_LANKA_BOUNDS = {
     "lat_min": 5.9,
@@ -24,42 +40,103 @@ SRI_LANKA_BOUNDS = {
     "lon_max": 81.9
 }
 
+# Bounds unpacked once so the per-item check does no dict lookups
+LAT_MIN = SRI_LANKA_BOUNDS["lat_min"]
+LAT_MAX = SRI_LANKA_BOUNDS["lat_max"]
+LON_MIN = SRI_LANKA_BOUNDS["lon_min"]
+LON_MAX = SRI_LANKA_BOUNDS["lon_max"]
+
+# Error/warning texts kept per validator; the report shows at most 100
+MAX_STORED_MESSAGES = 200
+
+# Sri Lankan numbers start with +94, 94 or a local 0
+PHONE_PREFIX_PATTERN = re.compile(r'(?:\+94|94|0)')
+
+
 class DatabaseValidator:
     def __init__(self, base_path: str):
         self.base_path = base_path
+        # Only the first MAX_STORED_MESSAGES of each are kept; the counts
+        # include every message
         self.errors = []
         self.warnings = []
+        self.error_count = 0
+        self.warning_count = 0
         self.stats = {}
+        # Well-formed coordinates awaiting the vectorized bounds check
+        self.staged_ids = []
+        self.staged_coords = []
+    
+    def add_error(self, message: str) -> None:
+        """Record an error, storing the text only while under the cap."""
+        self.error_count += 1
+        if len(self.errors) < MAX_STORED_MESSAGES:
+            self.errors.append(message)
+    
+    def add_warning(self, message: str) -> None:
+        """Record a warning, storing the text only while under the cap."""
+        self.warning_count += 1
+        if len(self.warnings) < MAX_STORED_MESSAGES:
+            self.warnings.append(message)
+    
+    def merge_messages(self, errors: List[str], error_count: int, warnings: List[str], warning_count: int) -> None:
+        """Fold another validator's capped messages and counts into this one."""
+        self.errors.extend(errors[:MAX_STORED_MESSAGES - len(self.errors)])
+        self.warnings.extend(warnings[:MAX_STORED_MESSAGES - len(self.warnings)])
+        self.error_count += error_count
+        self.warning_count += warning_count
+    
+    def iter_items(self, filepath: str) -> Iterator[Dict[str, Any]]:
+        """Stream the items of a JSON array file one at a time from a read-only memory map."""
+        if ijson is None:
+            raise ImportError("ijson is required to stream database files: pip install ijson")
+        with open(filepath, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield from ijson.items(mm, "item", use_float=True)
     
     def validate_coordinates(self, coords: List[float], item_id: str) -> bool:
-        """Validate if coordinates are within Sri Lanka bounds."""
+        """Validate the coordinates format; bounds are checked in bulk by check_staged_coordinates."""
         if not coords or len(coords) != 2:
-            self.errors.append(f"{item_id}: Invalid coordinates format: {coords}")
-            return False
-        
-        lon, lat = coords
-        if not (SRI_LANKA_BOUNDS["lon_min"] <= lon <= SRI_LANKA_BOUNDS["lon_max"]):
-            self.errors.append(f"{item_id}: Longitude {lon} out of bounds")
-            return False
-        
-        if not (SRI_LANKA_BOUNDS["lat_min"] <= lat <= SRI_LANKA_BOUNDS["lat_max"]):
-            self.errors.append(f"{item_id}: Latitude {lat} out of bounds")
+            self.add_error(f"{item_id}: Invalid coordinates format: {coords}")
             return False
         
+        self.staged_ids.append(item_id)
+        self.staged_coords.append(coords)
         return True
     
+    def check_staged_coordinates(self) -> None:
+        """Check every staged coordinate pair against Sri Lanka bounds in one NumPy pass."""
+        if not self.staged_coords:
+            return
+        
+        arr = np.asarray(self.staged_coords, dtype=np.float64)
+        lons, lats = arr[:, 0], arr[:, 1]
+        # Negated in-range tests so NaN is reported as out of bounds
+        bad_lon = ~((lons >= LON_MIN) & (lons <= LON_MAX))
+        bad_lat = ~((lats >= LAT_MIN) & (lats <= LAT_MAX))
+        
+        for i in np.flatnonzero(bad_lon | bad_lat):
+            item_id = self.staged_ids[i]
+            lon, lat = self.staged_coords[i]
+            if bad_lon[i]:
+                self.add_error(f"{item_id}: Longitude {lon} out of bounds")
+            else:
+                self.add_error(f"{item_id}: Latitude {lat} out of bounds")
+        
+        self.staged_ids.clear()
+        self.staged_coords.clear()
+    
     def validate_multilingual_field(self, field: Dict[str, str], item_id: str, field_name: str) -> bool:
         """Validate multilingual fields have required languages."""
         required_langs = ["en", "si", "ta"]
         if not isinstance(field, dict):
-            self.errors.append(f"{item_id}: {field_name} is not a dictionary")
+            self.add_error(f"{item_id}: {field_name} is not a dictionary")
             return False
         
         for lang in required_langs:
             if lang not in field:
-                self.warnings.append(f"{item_id}: Missing {lang} translation in {field_name}")
+                self.add_warning(f"{item_id}: Missing {lang} translation in {field_name}")
             elif not field[lang] or len(field[lang].strip()) == 0:
-                self.warnings.append(f"{item_id}: Empty {lang} translation in {field_name}")
+                self.add_warning(f"{item_id}: Empty {lang} translation in {field_name}")
         
         return True
     
@@ -69,292 +146,123 @@ class DatabaseValidator:
             return True  # Optional field
         
         # Check for +94 country code
-        if not (phone.startswith("+94") or phone.startswith("94") or phone.startswith("0")):
-            self.warnings.append(f"{item_id}: Phone number {phone} doesn't follow Sri Lankan format")
+        if not PHONE_PREFIX_PATTERN.match(phone):
+            self.add_warning(f"{item_id}: Phone number {phone} doesn't follow Sri Lankan format")
             return False
         
         return True
     
-    def validate_master_database(self) -> Dict[str, Any]:
-        """Validate master_database_enhanced.json."""
-        print("[*] Validating master_database_enhanced.json...")
+    def validate_file(self, schema: Tuple) -> Dict[str, Any]:
+        """Validate one database file against its entry in SCHEMAS."""
+        _, filename, label, id_field, required_fields, check_item = schema
+        print(f"[*] Validating {filename}...")
         
-        filepath = os.path.join(self.base_path, "master_database_enhanced.json")
+        filepath = os.path.join(self.base_path, filename)
         if not os.path.exists(filepath):
-            self.errors.append("master_database_enhanced.json not found")
+            self.add_error(f"{filename} not found")
             return {"valid": False}
         
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        
-        total = len(data)
+        total = 0
         valid_count = 0
         
-        for item in data:
-            item_id = item.get("original_id", "UNKNOWN")
+        for item in self.iter_items(filepath):
+            total += 1
+            item_id = item.get(id_field, "UNKNOWN")
             is_valid = True
             
-            # Check required fields
-            if "name" not in item:
-                self.errors.append(f"{item_id}: Missing 'name' field")
+            # Check required fields (set difference against the item's keys)
+            missing = required_fields.difference(item)
+            if missing:
+                for field in sorted(missing):
+                    self.add_error(f"{item_id}: Missing '{field}' field")
                 is_valid = False
-            else:
-                self.validate_multilingual_field(item["name"], item_id, "name")
             
-            if "description" not in item:
-                self.errors.append(f"{item_id}: Missing 'description' field")
+            # Type-specific checks
+            if check_item and not check_item(self, item, item_id):
                 is_valid = False
-            else:
-                self.validate_multilingual_field(item["description"], item_id, "description")
-            
-            # Validate location
-            if "location" in item:
-                if "coordinates" in item["location"]:
-                    self.validate_coordinates(item["location"]["coordinates"], item_id)
-                else:
-                    self.warnings.append(f"{item_id}: Missing coordinates")
-            
-            # Validate contact info
-            if "contact_info" in item and "phone" in item["contact_info"]:
-                self.validate_phone_number(item["contact_info"]["phone"], item_id)
             
             if is_valid:
                 valid_count += 1
         
+        self.check_staged_coordinates()
+        
         stats = {
             "total": total,
             "valid": valid_count,
             "invalid": total - valid_count
         }
         
-        print(f"[OK] Master Database: {valid_count}/{total} valid")
+        print(f"[OK] {label}: {valid_count}/{total} valid")
         return stats
     
-    def validate_activities_database(self) -> Dict[str, Any]:
-        """Validate activities_database.json."""
-        print("[*] Validating activities_database.json...")
-        
-        filepath = os.path.join(self.base_path, "activities_database.json")
-        if not os.path.exists(filepath):
-            self.errors.append("activities_database.json not found")
-            return {"valid": False}
-        
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        
-        total = len(data)
-        valid_count = 0
-        
-        for item in data:
-            item_id = item.get("id", "UNKNOWN")
-            is_valid = True
-            
-            # Check required fields
-            required_fields = ["name", "description", "category", "activity_type", "location", "duration_hours", "price"]
-            for field in required_fields:
-                if field not in item:
-                    self.errors.append(f"{item_id}: Missing '{field}' field")
-                    is_valid = False
-            
-            # Validate multilingual
-            if "name" in item:
-                self.validate_multilingual_field(item["name"], item_id, "name")
-            if "description" in item:
-                self.validate_multilingual_field(item["description"], item_id, "description")
-            
-            # Validate location
-            if "location" in item and "coordinates" in item["location"]:
+    def check_master_item(self, item: Dict[str, Any], item_id: str) -> bool:
+        """Master database checks: translations, coordinates and phone."""
+        if "name" in item:
+            self.validate_multilingual_field(item["name"], item_id, "name")
+        if "description" in item:
+            self.validate_multilingual_field(item["description"], item_id, "description")
+        
+        # Validate location
+        if "location" in item:
+            if "coordinates" in item["location"]:
                 self.validate_coordinates(item["location"]["coordinates"], item_id)
-            
-            # Validate price
-            if "price" in item:
-                if "adult" not in item["price"] or "currency" not in item["price"]:
-                    self.errors.append(f"{item_id}: Invalid price structure")
-                    is_valid = False
-            
-            if is_valid:
-                valid_count += 1
+            else:
+                self.add_warning(f"{item_id}: Missing coordinates")
         
-        stats = {
-            "total": total,
-            "valid": valid_count,
-            "invalid": total - valid_count
-        }
+        # Validate contact info
+        if "contact_info" in item and "phone" in item["contact_info"]:
+            self.validate_phone_number(item["contact_info"]["phone"], item_id)
         
-        print(f"[OK] Activities: {valid_count}/{total} valid")
-        return stats
+        return True
     
-    def validate_events_database(self) -> Dict[str, Any]:
-        """Validate events_database.json."""
-        print("[*] Validating events_database.json...")
+    def check_activity_item(self, item: Dict[str, Any], item_id: str) -> bool:
+        """Activity checks: translations, coordinates and price structure."""
+        # Validate multilingual
+        if "name" in item:
+            self.validate_multilingual_field(item["name"], item_id, "name")
+        if "description" in item:
+            self.validate_multilingual_field(item["description"], item_id, "description")
+        
+        # Validate location
+        if "location" in item and "coordinates" in item["location"]:
+            self.validate_coordinates(item["location"]["coordinates"], item_id)
+        
+        # Validate price
+        if "price" in item:
+            if "adult" not in item["price"] or "currency" not in item["price"]:
+                self.add_error(f"{item_id}: Invalid price structure")
+                return False
         
-        filepath = os.path.join(self.base_path, "events_database.json")
-        if not os.path.exists(filepath):
-            self.errors.append("events_database.json not found")
-            return {"valid": False}
-        
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        
-        total = len(data)
-        valid_count = 0
-        
-        for item in data:
-            item_id = item.get("id", "UNKNOWN")
-            is_valid = True
-            
-            # Check required fields
-            required_fields = ["name", "description", "category", "event_type", "location", "date_info"]
-            for field in required_fields:
-                if field not in item:
-                    self.errors.append(f"{item_id}: Missing '{field}' field")
-                    is_valid = False
-            
-            # Validate date format
-            if "date_info" in item:
-                if "start_date" not in item["date_info"] or "end_date" not in item["date_info"]:
-                    self.errors.append(f"{item_id}: Invalid date_info structure")
-                    is_valid = False
-            
-            if is_valid:
-                valid_count += 1
-        
-        stats = {
-            "total": total,
-            "valid": valid_count,
-            "invalid": total - valid_count
-        }
-        
-        print(f"[OK] Events: {valid_count}/{total} valid")
-        return stats
+        return True
     
-    def validate_hotels_database(self) -> Dict[str, Any]:
-        """Validate hotels_database.json."""
-        print("[*] Validating hotels_database.json...")
-        
-        filepath = os.path.join(self.base_path, "hotels_database.json")
-        if not os.path.exists(filepath):
-            self.errors.append("hotels_database.json not found")
-            return {"valid": False}
-        
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        
-        total = len(data)
-        valid_count = 0
-        
-        for item in data:
-            item_id = item.get("id", "UNKNOWN")
-            is_valid = True
-            
-            # Check required fields
-            required_fields = ["name", "description", "category", "star_rating", "location", "price_range"]
-            for field in required_fields:
-                if field not in item:
-                    self.errors.append(f"{item_id}: Missing '{field}' field")
-                    is_valid = False
-            
-            # Validate price range
-            if "price_range" in item:
-                if "min_price" not in item["price_range"] or "max_price" not in item["price_range"]:
-                    self.errors.append(f"{item_id}: Invalid price_range structure")
-                    is_valid = False
-                elif item["price_range"]["min_price"] > item["price_range"]["max_price"]:
-                    self.errors.append(f"{item_id}: min_price greater than max_price")
-                    is_valid = False
-            
-            if is_valid:
-                valid_count += 1
-        
-        stats = {
-            "total": total,
-            "valid": valid_count,
-            "invalid": total - valid_count
-        }
+    def check_event_item(self, item: Dict[str, Any], item_id: str) -> bool:
+        """Event checks: date_info structure."""
+        if "date_info" in item:
+            if "start_date" not in item["date_info"] or "end_date" not in item["date_info"]:
+                self.add_error(f"{item_id}: Invalid date_info structure")
+                return False
         
-        print(f"[OK] Hotels: {valid_count}/{total} valid")
-        return stats
+        return True
     
-    def validate_restaurants_database(self) -> Dict[str, Any]:
-        """Validate restaurants_database.json."""
-        print("[*] Validating restaurants_database.json...")
-        
-        filepath = os.path.join(self.base_path, "restaurants_database.json")
-        if not os.path.exists(filepath):
-            self.errors.append("restaurants_database.json not found")
-            return {"valid": False}
-        
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        
-        total = len(data)
-        valid_count = 0
-        
-        for item in data:
-            item_id = item.get("id", "UNKNOWN")
-            is_valid = True
-            
-            # Check required fields
-            required_fields = ["name", "description", "cuisine_types", "price_range", "location"]
-            for field in required_fields:
-                if field not in item:
-                    self.errors.append(f"{item_id}: Missing '{field}' field")
-                    is_valid = False
-            
-            # Validate cuisine types
-            if "cuisine_types" in item:
-                if not isinstance(item["cuisine_types"], list) or len(item["cuisine_types"]) == 0:
-                    self.warnings.append(f"{item_id}: No cuisine types specified")
-            
-            if is_valid:
-                valid_count += 1
-        
-        stats = {
-            "total": total,
-            "valid": valid_count,
-            "invalid": total - valid_count
-        }
+    def check_hotel_item(self, item: Dict[str, Any], item_id: str) -> bool:
+        """Hotel checks: price_range structure and ordering."""
+        if "price_range" in item:
+            if "min_price" not in item["price_range"] or "max_price" not in item["price_range"]:
+                self.add_error(f"{item_id}: Invalid price_range structure")
+                return False
+            elif item["price_range"]["min_price"] > item["price_range"]["max_price"]:
+                self.add_error(f"{item_id}: min_price greater than max_price")
+                return False
         
-        print(f"[OK] Restaurants: {valid_count}/{total} valid")
-        return stats
+        return True
     
-    def validate_transportation_database(self) -> Dict[str, Any]:
-        """Validate transportation_database.json."""
-        print("[*] Validating transportation_database.json...")
-        
-        filepath = os.path.join(self.base_path, "transportation_database.json")
-        if not os.path.exists(filepath):
-            self.errors.append("transportation_database.json not found")
-            return {"valid": False}
-        
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        
-        total = len(data)
-        valid_count = 0
-        
-        for item in data:
-            item_id = item.get("id", "UNKNOWN")
-            is_valid = True
-            
-            # Check required fields
-            required_fields = ["type", "name", "description"]
-            for field in required_fields:
-                if field not in item:
-                    self.errors.append(f"{item_id}: Missing '{field}' field")
-                    is_valid = False
-            
-            if is_valid:
-                valid_count += 1
+    def check_restaurant_item(self, item: Dict[str, Any], item_id: str) -> bool:
+        """Restaurant checks: at least one cuisine type."""
+        if "cuisine_types" in item:
+            if not isinstance(item["cuisine_types"], list) or len(item["cuisine_types"]) == 0:
+                self.add_warning(f"{item_id}: No cuisine types specified")
         
-        stats = {
-            "total": total,
-            "valid": valid_count,
-            "invalid": total - valid_count
-        }
-        
-        print(f"[OK] Transportation: {valid_count}/{total} valid")
-        return stats
+        return True
     
     def detect_duplicates(self) -> Dict[str, List[str]]:
         """Detect duplicate entries across databases."""
@@ -365,14 +273,18 @@ class DatabaseValidator:
         # Check master database
         filepath = os.path.join(self.base_path, "master_database_enhanced.json")
         if os.path.exists(filepath):
-            with open(filepath, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            
-            names = {}
-            for item in data:
-                name = item.get("name", {}).get("en", "")
-                location = item.get("location", {}).get("city", "")
-                key = f"{name}_{location}".lower()
+            names: Dict[Tuple[str, str], str] = {}
+            for item in self.iter_items(filepath):
+                # Missing, null or non-dict parents all fall back to an empty key part
+                try:
+                    name = item["name"]["en"] or ""
+                except (KeyError, TypeError):
+                    name = ""
+                try:
+                    location = item["location"]["city"] or ""
+                except (KeyError, TypeError):
+                    location = ""
+                key = (name.lower(), location.lower())
                 
                 if key in names:
                     duplicates["master_database"].append(f"Duplicate: {name} in {location}")
@@ -391,16 +303,18 @@ class DatabaseValidator:
         
         results = {}
         
-        # Validate each database
-        results["master_database"] = self.validate_master_database()
-        results["activities"] = self.validate_activities_database()
-        results["events"] = self.validate_events_database()
-        results["hotels"] = self.validate_hotels_database()
-        results["restaurants"] = self.validate_restaurants_database()
-        results["transportation"] = self.validate_transportation_database()
-        
-        # Check duplicates
-        duplicates = self.detect_duplicates()
+        # Validate each database in its own process; the duplicate scan runs
+        # here meanwhile, and results are merged back in SCHEMAS order
+        with ProcessPoolExecutor(max_workers=len(SCHEMAS)) as executor:
+            futures = [executor.submit(validate_schema, self.base_path, schema) for schema in SCHEMAS]
+            
+            # Check duplicates
+            duplicates = self.detect_duplicates()
+            
+            for schema, future in zip(SCHEMAS, futures):
+                stats, *messages = future.result()
+                results[schema[0]] = stats
+                self.merge_messages(*messages)
         
         # Print summary
         print()
@@ -414,29 +328,29 @@ class DatabaseValidator:
         print(f"Total Items:     {total_items}")
         print(f"Valid Items:     {total_valid}")
         print(f"Invalid Items:   {total_items - total_valid}")
-        print(f"Errors:          {len(self.errors)}")
-        print(f"Warnings:        {len(self.warnings)}")
+        print(f"Errors:          {self.error_count}")
+        print(f"Warnings:        {self.warning_count}")
         print()
         
         if self.errors:
             print("ERRORS:")
             for error in self.errors[:20]:  # Show first 20 errors
                 print(f"  - {error}")
-            if len(self.errors) > 20:
-                print(f"  ... and {len(self.errors) - 20} more errors")
+            if self.error_count > 20:
+                print(f"  ... and {self.error_count - 20} more errors")
             print()
         
         if self.warnings:
             print("WARNINGS:")
             for warning in self.warnings[:20]:  # Show first 20 warnings
                 print(f"  - {warning}")
-            if len(self.warnings) > 20:
-                print(f"  ... and {len(self.warnings) - 20} more warnings")
+            if self.warning_count > 20:
+                print(f"  ... and {self.warning_count - 20} more warnings")
             print()
         
         print("=" * 80)
         
-        if len(self.errors) == 0:
+        if self.error_count == 0:
             print("[OK] All databases passed validation!")
         else:
             print("[WARNING] Some databases have validation errors. Please review.")
@@ -447,12 +361,41 @@ class DatabaseValidator:
             "results": results,
             "total_items": total_items,
             "total_valid": total_valid,
-            "errors": len(self.errors),
-            "warnings": len(self.warnings),
+            "errors": self.error_count,
+            "warnings": self.warning_count,
             "duplicates": len(duplicates)
         }
 
 
+# Databases to validate: (result key, filename, report label, id field,
+# required fields, type-specific item check)
+SCHEMAS = (
+    ("master_database", "master_database_enhanced.json", "Master Database", "original_id",
+     frozenset(["name", "description"]), DatabaseValidator.check_master_item),
+    ("activities", "activities_database.json", "Activities", "id",
+     frozenset(["name", "description", "category", "activity_type", "location", "duration_hours", "price"]),
+     DatabaseValidator.check_activity_item),
+    ("events", "events_database.json", "Events", "id",
+     frozenset(["name", "description", "category", "event_type", "location", "date_info"]),
+     DatabaseValidator.check_event_item),
+    ("hotels", "hotels_database.json", "Hotels", "id",
+     frozenset(["name", "description", "category", "star_rating", "location", "price_range"]),
+     DatabaseValidator.check_hotel_item),
+    ("restaurants", "restaurants_database.json", "Restaurants", "id",
+     frozenset(["name", "description", "cuisine_types", "price_range", "location"]),
+     DatabaseValidator.check_restaurant_item),
+    ("transportation", "transportation_database.json", "Transportation", "id",
+     frozenset(["type", "name", "description"]), None),
+)
+
+
+def validate_schema(base_path: str, schema: Tuple) -> Tuple[Dict[str, Any], List[str], int, List[str], int]:
+    """Validate one database in a worker process; returns (stats, errors, error_count, warnings, warning_count)."""
+    validator = DatabaseValidator(base_path)
+    stats = validator.validate_file(schema)
+    return stats, validator.errors, validator.error_count, validator.warnings, validator.warning_count
+
+
 def main():
     """Main validation function."""
     base_path = "e:/Multilingual_Chatbot_for_Sri_Lanka_Tourism_V1"
@@ -462,13 +405,18 @@ def main():
     
     # Save validation report
     report_path = os.path.join(base_path, "database_validation_report.json")
-    with open(report_path, "w", encoding="utf-8") as f:
-        json.dump({
-            "timestamp": "2025-12-13",
-            "summary": results,
-            "errors": validator.errors[:100],  # Save first 100 errors
-            "warnings": validator.warnings[:100]  # Save first 100 warnings
-        }, f, indent=2)
+    report = {
+        "timestamp": "2025-12-13",
+        "summary": results,
+        "errors": validator.errors[:100],  # Save first 100 errors
+        "warnings": validator.warnings[:100]  # Save first 100 warnings
+    }
+    if ORJSON_AVAILABLE:
+        with open(report_path, "wb") as f:
+            f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+    else:
+        with open(report_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
     
     print(f"\n[OK] Validation report saved to: {report_path}")
 
@@ -7,53 +7,149 @@ import asyncio
 import sys
 import os
 from pathlib import Path
-from typing import List, Dict, Any
-from urllib.parse import urlparse
+from typing import List, Dict, Any, NamedTuple, Optional, Tuple
+import re
+from html import escape
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from motor.motor_asyncio import AsyncIOMotorClient
+import aiofiles
 from backend.app.core.config import settings
+from scripts._mongo import get_client, close_client
 import logging
 
 logging.basicConfig(level=logging.INFO, format='%(message)s')
 logger = logging.getLogger(__name__)
 
+# http(s) scheme followed by a non-empty host, as urlparse would split it
+URL_PATTERN = re.compile(r'https?://[^/?#]+', re.IGNORECASE)
 
-def format_image_info(image: Any, index: int) -> str:
-    """Format image information for display"""
-    if isinstance(image, str):
-        return f"  [{index}] URL: {image}"
-    elif isinstance(image, dict):
-        url = image.get('url') or image.get('_url') or 'NO URL'
-        is_primary = image.get('is_primary', False)
-        alt_text = image.get('alt_text', {})
-        alt_en = alt_text.get('en', '') if isinstance(alt_text, dict) else ''
-        
-        primary_marker = " ⭐ PRIMARY" if is_primary else ""
-        return f"  [{index}] URL: {url}{primary_marker}\n      Alt: {alt_en}"
-    else:
-        return f"  [{index}] Invalid format: {type(image)}"
+# Documents whose images array has at least one element
+HAS_IMAGES_FILTER = {"images.0": {"$exists": True}}
+
+# Only the fields the renderers read (plus _id), with the display name picked server-side
+SAMPLE_PROJECTION = {
+    "name": {"$cond": [
+        # Some documents store a plain string name rather than a language dict
+        {"$eq": [{"$type": "$name"}, "string"]},
+        "$name",
+        {"$ifNull": ["$name.en", {"$ifNull": ["$name.si", {"$ifNull": ["$name.ta", "Unknown"]}]}]},
+    ]},
+    "images": 1,
+}
+
+# Per-image URL validity counted server-side (after HAS_IMAGES_FILTER): string entries are the URL, dict entries carry url or _url
+URL_STATS_STAGES = [
+    {"$unwind": "$images"},
+    {"$project": {"url": {"$switch": {
+        "branches": [
+            {"case": {"$eq": [{"$type": "$images"}, "string"]}, "then": "$images"},
+            {"case": {"$eq": [{"$type": "$images"}, "object"]}, "then": {"$ifNull": ["$images.url", "$images._url"]}},
+        ],
+        "default": None,
+    }}}},
+    {"$group": {
+        "_id": None,
+        "valid": {"$sum": {"$cond": [
+            {"$cond": [
+                {"$eq": [{"$type": "$url"}, "string"]},
+                {"$regexMatch": {"input": "$url", "regex": "^" + URL_PATTERN.pattern, "options": "i"}},
+                False,
+            ]},
+            1,
+            0,
+        ]}},
+        "total": {"$sum": 1},
+    }},
+]
+
+# Documents per collection in the HTML report, and per cursor batch while streaming them
+REPORT_SAMPLE_LIMIT = 50
+REPORT_BATCH_SIZE = 25
 
 
 def validate_url(url: str) -> bool:
     """Check if URL is valid"""
     if not url or not isinstance(url, str):
         return False
-    try:
-        result = urlparse(url)
-        return all([result.scheme in ['http', 'https'], result.netloc])
-    except:
-        return False
+    return URL_PATTERN.match(url) is not None
+
+
+class NormalizedImage(NamedTuple):
+    """Fields both renderers read from a stored image entry"""
+    url: Optional[str]
+    is_primary: bool
+    alt_en: str
+    valid: bool
+
+
+def normalize_image(image: Any) -> Optional[NormalizedImage]:
+    """Extract url, primary flag, English alt text and validity; None for unsupported formats"""
+    if isinstance(image, str):
+        return NormalizedImage(image, False, '', validate_url(image))
+    if isinstance(image, dict):
+        url = image.get('url') or image.get('_url')
+        alt_text = image.get('alt_text', {})
+        alt_en = (alt_text.get('en') or '') if isinstance(alt_text, dict) else ''
+        return NormalizedImage(url, bool(image.get('is_primary', False)), alt_en, validate_url(url))
+    return None
+
+
+# Stand-in rendered for image entries of an unsupported type
+INVALID_IMAGE = NormalizedImage(None, False, '', False)
 
+# Normalized images keyed by (collection name, document _id)
+NormalizedIndex = Dict[Tuple[str, Any], List[Optional[NormalizedImage]]]
 
-async def view_images_in_collection(collection_name: str, db: Any, limit: int = 10):
+
+def normalized_images(doc: Dict[str, Any]) -> List[Optional[NormalizedImage]]:
+    """Normalize every image entry of a document"""
+    return [normalize_image(image) for image in doc.get('images', [])]
+
+
+def format_image_info(image: Any, info: Optional[NormalizedImage], index: int) -> str:
+    """Format image information for display"""
+    if info is None:
+        return f"  [{index}] Invalid format: {type(image)}"
+    primary_marker = " ⭐ PRIMARY" if info.is_primary else ""
+    line = f"  [{index}] URL: {info.url or 'NO URL'}{primary_marker}"
+    if info.alt_en:
+        line += f"\n      Alt: {info.alt_en}"
+    return line
+
+
+async def fetch_collection_images(collection: Any, limit: int):
+    """Fetch the document count, image URL counts and up to limit documents with images concurrently"""
+    pipeline = [
+        # $facet reads every document that reaches it, so filter before branching
+        {"$match": HAS_IMAGES_FILTER},
+        {"$facet": {
+            "sample": [
+                {"$limit": limit},
+                {"$project": SAMPLE_PROJECTION},
+            ],
+            "url_stats": URL_STATS_STAGES,
+        }}
+    ]
+    # The count is informational, so read it from collection metadata instead of scanning
+    total_count, facets = await asyncio.gather(
+        collection.estimated_document_count(),
+        collection.aggregate(pipeline).to_list(length=1),
+    )
+    result = facets[0]
+    stats = result["url_stats"][0] if result["url_stats"] else {"valid": 0, "total": 0}
+    return total_count, result["sample"], (stats["valid"], stats["total"])
+
+
+def show_images_in_collection(
+    collection_name: str,
+    total_count: int,
+    docs_with_images: List[Dict[str, Any]],
+    url_stats: Tuple[int, int],
+    normalized: NormalizedIndex,
+):
     """View images in a specific collection"""
-    collection = db[collection_name]
-    
-    # Count total documents
-    total_count = await collection.count_documents({})
     logger.info(f"\n{'='*80}")
     logger.info(f"📁 Collection: {collection_name.upper()}")
     logger.info(f"📊 Total Documents: {total_count}")
@@ -63,28 +159,14 @@ async def view_images_in_collection(collection_name: str, db: Any, limit: int =
         logger.info("   ⚠️  No documents found in this collection")
         return
     
-    # Find documents with images
-    cursor = collection.find({"images": {"$exists": True, "$ne": []}})
-    docs_with_images = await cursor.to_list(length=limit)
-    
     if not docs_with_images:
         logger.info("   ⚠️  No documents with images found")
         return
     
     logger.info(f"\n📸 Showing {len(docs_with_images)} documents with images:\n")
     
-    valid_images_count = 0
-    invalid_images_count = 0
-    
     for idx, doc in enumerate(docs_with_images, 1):
-        # Get name
-        name_obj = doc.get('name', {})
-        if isinstance(name_obj, dict):
-            name = name_obj.get('en') or name_obj.get('si') or name_obj.get('ta') or 'Unknown'
-        else:
-            name = str(name_obj) if name_obj else 'Unknown'
-        
-        # Get ID
+        name = doc['name']
         doc_id = str(doc.get('_id', 'Unknown'))
         
         logger.info(f"\n{idx}. {name}")
@@ -97,36 +179,24 @@ async def view_images_in_collection(collection_name: str, db: Any, limit: int =
         
         logger.info(f"   📷 Total Images: {len(images)}")
         
-        for img_idx, image in enumerate(images, 1):
-            img_info = format_image_info(image, img_idx)
-            logger.info(img_info)
+        for img_idx, (image, info) in enumerate(zip(images, normalized[(collection_name, doc['_id'])]), 1):
+            logger.info(format_image_info(image, info, img_idx))
             
-            # Validate URL
-            url = None
-            if isinstance(image, str):
-                url = image
-            elif isinstance(image, dict):
-                url = image.get('url') or image.get('_url')
-            
-            if url and validate_url(url):
-                valid_images_count += 1
+            if info is not None and info.valid:
                 logger.info(f"      ✅ Valid URL")
             else:
-                invalid_images_count += 1
                 logger.info(f"      ❌ Invalid or missing URL")
     
+    # Counts cover every document in the collection, not just the sample above
+    valid_images_count, total_images_count = url_stats
     logger.info(f"\n{'─'*80}")
-    logger.info(f"📊 Summary for {collection_name}:")
+    logger.info(f"📊 Summary for {collection_name} (all documents):")
     logger.info(f"   ✅ Valid Images: {valid_images_count}")
-    logger.info(f"   ❌ Invalid Images: {invalid_images_count}")
+    logger.info(f"   ❌ Invalid Images: {total_images_count - valid_images_count}")
     logger.info(f"{'─'*80}")
 
 
-async def generate_html_report(db: Any, output_file: str = "database_images_report.html"):
-    """Generate HTML report with clickable image links"""
-    collections = ['attractions', 'hotels', 'restaurants', 'events']
-    
-    html_content = """
+HTML_REPORT_HEADER = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -152,84 +222,104 @@ async def generate_html_report(db: Any, output_file: str = "database_images_repo
         <div class="container">
             <h1>📸 Database Images Report</h1>
     """
+
+HTML_REPORT_FOOTER = """
+        </div>
+    </body>
+    </html>
+    """
+
+
+# Per-collection, per-document and per-image fragments, bound to format_map once
+HTML_COLLECTION_OPEN = """
+                <div class="collection">
+                    <h2>{title} ({count} items with images)</h2>
+            """.format_map
+
+HTML_ITEM_OPEN = """
+                    <div class="item">
+                        <div class="item-name">{name}</div>
+                        <div style="color: #666; font-size: 12px;">ID: {doc_id}</div>
+                        <div class="image-list">
+                """.format_map
+
+HTML_IMAGE_ITEM = """
+                        <div class="image-item {primary_class}">
+                            <strong>Image {index}</strong> {status}
+                            {primary_marker}<br>
+                            {alt}<br>
+                            <a href="{href}" target="_blank" class="image-url">
+                                {label}
+                            </a>
+                        </div>
+                    """.format_map
+
+HTML_ITEM_CLOSE = """
+                        </div>
+                    </div>
+                """
+
+
+async def generate_html_report(
+    db: Any,
+    output_file: str = "database_images_report.html",
+    normalized: Optional[NormalizedIndex] = None,
+):
+    """Generate HTML report with clickable image links, reusing images already normalized for the console"""
+    normalized = normalized or {}
+    collections = ['attractions', 'hotels', 'restaurants', 'events']
     
-    for collection_name in collections:
-        collection = db[collection_name]
-        total_count = await collection.count_documents({})
-        cursor = collection.find({"images": {"$exists": True, "$ne": []}})
-        docs_with_images = await cursor.to_list(length=50)
-        
-        if not docs_with_images:
-            continue
-        
-        html_content += f"""
-            <div class="collection">
-                <h2>{collection_name.upper()} ({len(docs_with_images)} items with images)</h2>
-        """
+    # Documents are rendered as cursor batches arrive; only one collection's capped section is held in memory
+    output_path = Path(__file__).parent.parent / output_file
+    async with aiofiles.open(output_path, 'w', encoding='utf-8') as f:
+        await f.write(HTML_REPORT_HEADER)
         
-        for doc in docs_with_images:
-            name_obj = doc.get('name', {})
-            if isinstance(name_obj, dict):
-                name = name_obj.get('en') or name_obj.get('si') or name_obj.get('ta') or 'Unknown'
-            else:
-                name = str(name_obj) if name_obj else 'Unknown'
-            
-            doc_id = str(doc.get('_id', 'Unknown'))
-            images = doc.get('images', [])
+        for collection_name in collections:
+            cursor = db[collection_name].find(
+                HAS_IMAGES_FILTER, SAMPLE_PROJECTION, limit=REPORT_SAMPLE_LIMIT
+            ).batch_size(REPORT_BATCH_SIZE)
+            items = []
             
-            html_content += f"""
-                <div class="item">
-                    <div class="item-name">{name}</div>
-                    <div style="color: #666; font-size: 12px;">ID: {doc_id}</div>
-                    <div class="image-list">
-            """
-            
-            for img_idx, image in enumerate(images, 1):
-                url = None
-                is_primary = False
-                alt_text = ''
+            async for doc in cursor:
+                doc_id = str(doc.get('_id', 'Unknown'))
                 
-                if isinstance(image, str):
-                    url = image
-                elif isinstance(image, dict):
-                    url = image.get('url') or image.get('_url')
-                    is_primary = image.get('is_primary', False)
-                    alt_obj = image.get('alt_text', {})
-                    if isinstance(alt_obj, dict):
-                        alt_text = alt_obj.get('en', '')
+                parts = [HTML_ITEM_OPEN({"name": escape(str(doc['name'])), "doc_id": escape(doc_id)})]
                 
-                is_valid = url and (url.startswith('http://') or url.startswith('https://'))
-                primary_class = 'primary' if is_primary else ''
-                status_class = 'valid' if is_valid else 'invalid'
-                status_text = '✅ Valid' if is_valid else '❌ Invalid'
+                # Documents beyond the console sample are normalized here and not kept
+                infos = normalized.get((collection_name, doc['_id']))
+                if infos is None:
+                    infos = normalized_images(doc)
                 
-                html_content += f"""
-                    <div class="image-item {primary_class}">
-                        <strong>Image {img_idx}</strong> {status_text}
-                        {f' ⭐ PRIMARY' if is_primary else ''}<br>
-                        {f'Alt: {alt_text}' if alt_text else ''}<br>
-                        <a href="{url if url else '#'}" target="_blank" class="image-url">
-                            {url if url else 'NO URL'}
-                        </a>
-                    </div>
-                """
+                for img_idx, info in enumerate(infos, 1):
+                    info = info or INVALID_IMAGE
+                    primary_class = 'primary' if info.is_primary else ''
+                    status_text = '✅ Valid' if info.valid else '❌ Invalid'
+                    
+                    # Database values are escaped before they reach the markup
+                    url_html = escape(info.url) if info.url else ''
+                    parts.append(HTML_IMAGE_ITEM({
+                        "primary_class": primary_class,
+                        "index": img_idx,
+                        "status": status_text,
+                        "primary_marker": ' ⭐ PRIMARY' if info.is_primary else '',
+                        "alt": 'Alt: ' + escape(info.alt_en) if info.alt_en else '',
+                        "href": url_html or '#',
+                        "label": url_html or 'NO URL',
+                    }))
+                
+                parts.append(HTML_ITEM_CLOSE)
+                items.append(''.join(parts))
             
-            html_content += """
-                    </div>
-                </div>
-            """
+            # Collections without images get no section at all
+            if not items:
+                continue
+            
+            # The heading carries the item count, so the section is written once the cursor is drained
+            await f.write(HTML_COLLECTION_OPEN({"title": collection_name.upper(), "count": len(items)}))
+            await f.write(''.join(items))
+            await f.write("</div>")
         
-        html_content += "</div>"
-    
-    html_content += """
-        </div>
-    </body>
-    </html>
-    """
-    
-    output_path = Path(__file__).parent.parent / output_file
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+        await f.write(HTML_REPORT_FOOTER)
     
     logger.info(f"\n✅ HTML report generated: {output_path}")
     logger.info(f"   Open this file in your browser to view images")
@@ -243,8 +333,7 @@ async def main():
     
     # Connect to MongoDB
     try:
-        client = AsyncIOMotorClient(settings.MONGODB_URL)
-        db = client[settings.DATABASE_NAME]
+        db = get_client()[settings.DATABASE_NAME]
         logger.info(f"✅ Connected to MongoDB: {settings.DATABASE_NAME}")
     except Exception as e:
         logger.error(f"❌ Failed to connect to MongoDB: {e}")
@@ -253,18 +342,25 @@ async def main():
     # Collections to check
     collections = ['attractions', 'hotels', 'restaurants', 'events']
     
-    # View images in each collection
-    for collection_name in collections:
-        await view_images_in_collection(collection_name, db, limit=20)
+    # Query all collections concurrently, then print them in order
+    snapshots = await asyncio.gather(
+        *(fetch_collection_images(db[collection_name], limit=20) for collection_name in collections)
+    )
+    # Normalize the console sample once; the HTML report reuses it for the same documents
+    normalized: NormalizedIndex = {}
+    for collection_name, (total_count, docs_with_images, url_stats) in zip(collections, snapshots):
+        for doc in docs_with_images:
+            normalized[(collection_name, doc['_id'])] = normalized_images(doc)
+        show_images_in_collection(collection_name, total_count, docs_with_images, url_stats, normalized)
     
     # Generate HTML report
     logger.info(f"\n{'='*80}")
     logger.info("Generating HTML Report...")
     logger.info(f"{'='*80}")
-    await generate_html_report(db)
+    await generate_html_report(db, normalized=normalized)
     
     # Close connection
-    client.close()
+    close_client()
     logger.info("\n✅ Done!")
 
 